@@ -6,7 +6,14 @@ Run this file for easy setup and sync operations.
 """
 
 import os
+import re
 import sys
+import json
+import shutil
+import traceback
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 
 # Add current directory to path for local imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -16,64 +23,218 @@ from utils.ui import (
     clear_screen, print_header, print_menu, print_submenu,
     get_choice, pause, safe_print, print_status,
     print_success, print_error, print_warning, print_info,
-    print_divider, print_box, Colors
+    print_divider, print_box, format_box, get_multiline_input,
+    make_stdout_lenient, Colors
 )
 from utils.clients import (
-    get_spotify_client, get_ytmusic_client,
+    get_spotify_client, get_ytmusic_client, get_all_spotify_playlists,
     check_spotify_configured, check_ytmusic_configured,
-    test_spotify_connection, test_ytmusic_connection
+    test_spotify_connection, test_ytmusic_connection, reset_clients,
+    get_ytmusic_library_playlists, invalidate_library_cache
 )
+from utils.auth_helper import (
+    precheck_headers_text, parse_headers, validate_headers,
+    check_auth_cookie, save_browser_auth
+)
+from utils.ytmusic_validator import check_ytmusic_auth, validate_all_playlists
+from config_updater import (
+    append_playlist_mappings, remove_playlist_mappings,
+    maybe_reload_config, read_config_literals, write_config_atomic
+)
+
+# With --verify-network, YouTube Music setup tests the saved headers against
+# the API instead of only checking them locally
+VERIFY_NETWORK = "--verify-network" in sys.argv
 
 
 # =============================================================================
 # CONFIG HELPERS
 # =============================================================================
 
-def get_playlist_mapping():
-    """Get current playlist mappings from config."""
+# String settings that _rewrite_config() can replace, matched in one pass
+# (the value may contain escaped quotes written by an earlier rewrite)
+_CONFIG_RE = re.compile(r'(SPOTIFY_CLIENT_ID|SPOTIFY_CLIENT_SECRET) = "(?:[^"\\\n]|\\.)*"')
+
+
+def _rewrite_config(**values):
+    """
+    Replace string settings in config.py in a single pass and save atomically.
+    
+    Args:
+        **values: Setting name -> new value (only names matched by _CONFIG_RE)
+    """
+    with open("config.py", "r", encoding="utf-8", newline="") as f:
+        content = f.read()
+    
+    def replace(match):
+        name = match.group(1)
+        if name not in values:
+            return match.group(0)
+        # json.dumps escapes quotes/backslashes, so pasted input can't
+        # break out of the string literal
+        return f'{name} = {json.dumps(values[name], ensure_ascii=False)}'
+    
+    write_config_atomic(_CONFIG_RE.sub(replace, content), "config.py")
+
+# Config values the menu needs, as read from config.py
+# (mapping_items is the mapping as a tuple of (spotify_id, ytmusic_id) pairs)
+ConfigSnapshot = namedtuple("ConfigSnapshot", ["mapping", "ytmusic_private", "mapping_items"])
+
+_EMPTY_SNAPSHOT = ConfigSnapshot({}, True, ())
+
+# Last snapshot, keyed by config.py's (mtime_ns, size)
+_CONFIG_CACHE = {"key": None, "value": _EMPTY_SNAPSHOT}
+
+
+def load_config_snapshot() -> ConfigSnapshot:
+    """
+    Get the playlist mapping and privacy flag from config.py.
+    
+    The file is only re-read when its mtime or size changes.
+    """
     try:
-        import importlib
-        import config
-        importlib.reload(config)
-        if hasattr(config, 'PLAYLIST_MAPPING'):
-            return config.PLAYLIST_MAPPING
+        st = os.stat("config.py")
+        key = (st.st_mtime_ns, st.st_size)
+        if key == _CONFIG_CACHE["key"]:
+            return _CONFIG_CACHE["value"]
+        
+        try:
+            values = read_config_literals({"PLAYLIST_MAPPING", "YTMUSIC_PLAYLIST_PRIVATE"}, "config.py")
+        except ValueError:
+            # Not plain literals (computed values etc.) - fall back to importing
+            values = vars(maybe_reload_config())
+        
+        mapping = values.get("PLAYLIST_MAPPING", {})
+        if not isinstance(mapping, dict):
+            mapping = {}
+        snapshot = ConfigSnapshot(
+            mapping,
+            bool(values.get("YTMUSIC_PLAYLIST_PRIVATE", True)),
+            tuple(mapping.items())
+        )
+        _CONFIG_CACHE["key"] = key
+        _CONFIG_CACHE["value"] = snapshot
+        return snapshot
     except Exception:
         pass
-    return {}
+    return _EMPTY_SNAPSHOT
+
+
+def get_playlist_mapping():
+    """Get current playlist mappings from config (cached until config.py changes)."""
+    return load_config_snapshot().mapping
+
+
+def get_playlist_mapping_items():
+    """Get current playlist mappings as a cached tuple of (spotify_id, ytmusic_id) pairs."""
+    return load_config_snapshot().mapping_items
+
+
+def invalidate_config_cache():
+    """Force the next load_config_snapshot() call to re-read config.py."""
+    _CONFIG_CACHE["key"] = None
+
+
+# Last (spotify_ok, ytmusic_ok), keyed by the config/auth files' mtimes
+_CONFIGURED_CACHE = {"key": None, "value": (False, False)}
+
+
+def _mtime_ns(path):
+    """File mtime in ns, or 0 if it doesn't exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def get_configured_status():
+    """
+    Get (spotify_ok, ytmusic_ok) for the status screens.
+    
+    Re-checked only when config.py or browser_auth.json changes.
+    """
+    key = (_mtime_ns("config.py"), _mtime_ns("browser_auth.json"))
+    if key != _CONFIGURED_CACHE["key"]:
+        _CONFIGURED_CACHE["value"] = (check_spotify_configured(), check_ytmusic_configured())
+        _CONFIGURED_CACHE["key"] = key
+    return _CONFIGURED_CACHE["value"]
+
+
+def invalidate_configured_cache():
+    """Force the next get_configured_status() call to re-check both services."""
+    _CONFIGURED_CACHE["key"] = None
+    mark_menu_dirty()
+
+
+# YouTube Music header check shown on the main menu, as (is_valid, message).
+# It costs a network round-trip, so it's only redone when browser_auth.json
+# changes or after an action that may have changed it marks it dirty.
+_MENU_STATUS = {"dirty": True, "key": None, "ytmusic": (False, "Not configured")}
+
+
+def mark_menu_dirty():
+    """Make the main menu re-check YouTube Music headers on its next draw."""
+    _MENU_STATUS["dirty"] = True
+
+
+# Set once config.py is known to exist; it is never deleted by the app
+_CONFIG_EXISTS_OK = False
 
 
 def ensure_config_exists():
     """Ensure config.py exists, create from example if needed."""
-    import shutil
+    global _CONFIG_EXISTS_OK
+    if _CONFIG_EXISTS_OK:
+        return True
+    
     if not os.path.exists("config.py"):
         if os.path.exists("config.example.py"):
             shutil.copy("config.example.py", "config.py")
             print_info("Created config.py from config.example.py")
+            _CONFIG_EXISTS_OK = True
             return True
         else:
             print_error("config.example.py not found!")
             return False
-    return os.path.exists("config.py")
+    _CONFIG_EXISTS_OK = True
+    return True
 
 
 # =============================================================================
 # SETUP FUNCTIONS
 # =============================================================================
 
-def setup_spotify():
-    """Interactive Spotify setup."""
-    print_header("SPOTIFY SETUP", "Configure your Spotify API credentials")
-    
-    print("You need to create a Spotify Developer App to use this tool.")
-    print()
-    print_box([
+# Fixed setup instructions, rendered once at import
+_SPOTIFY_SETUP_TEXT = "\n".join([
+    "You need to create a Spotify Developer App to use this tool.",
+    "",
+    format_box([
         "1. Go to: https://developer.spotify.com/dashboard",
         "2. Log in and click 'Create App'",
         "3. Fill in any name and description",
         "4. Set Redirect URI to: http://127.0.0.1:8888/callback",
         "5. Save and get your Client ID and Client Secret"
-    ], "Steps")
-    print()
+    ], "Steps"),
+    "",
+])
+
+_YTMUSIC_SETUP_TEXT = format_box([
+    "OPTION 1 - Easiest (Recommended):",
+    "  Run: python setup_browser_auth.py",
+    "",
+    "OPTION 2 - Quick (if you know what you're doing):",
+    "  1. Go to https://music.youtube.com (signed in)",
+    "  2. Press F12 > Network tab > filter 'browse'",
+    "  3. Click 'Library' in YouTube Music",
+    "  4. Find a POST request to 'browse?...'",
+    "  5. Copy headers: Chrome (Copy as cURL bash) | Firefox (Copy Request Headers)"
+]) + "\n"
+
+
+def setup_spotify():
+    """Interactive Spotify setup."""
+    print_header("SPOTIFY SETUP", "Configure your Spotify API credentials")
+    safe_print(_SPOTIFY_SETUP_TEXT)
     
     client_id = input("Enter your Spotify Client ID: ").strip()
     if not client_id:
@@ -90,29 +251,12 @@ def setup_spotify():
     # Update config.py
     try:
         ensure_config_exists()
-        
-        with open("config.py", "r", encoding="utf-8") as f:
-            content = f.read()
-        
-        import re
-        content = re.sub(
-            r'SPOTIFY_CLIENT_ID = "[^"]*"',
-            f'SPOTIFY_CLIENT_ID = "{client_id}"',
-            content
-        )
-        content = re.sub(
-            r'SPOTIFY_CLIENT_SECRET = "[^"]*"',
-            f'SPOTIFY_CLIENT_SECRET = "{client_secret}"',
-            content
-        )
-        
-        with open("config.py", "w", encoding="utf-8") as f:
-            f.write(content)
+        _rewrite_config(SPOTIFY_CLIENT_ID=client_id, SPOTIFY_CLIENT_SECRET=client_secret)
         
         # Force reload config module to pick up new values
-        import importlib
-        import config
-        importlib.reload(config)
+        maybe_reload_config(force=True)
+        invalidate_configured_cache()
+        reset_clients()
         
         print_success("Spotify credentials saved!")
         
@@ -136,19 +280,7 @@ def setup_spotify():
 def setup_ytmusic():
     """Interactive YouTube Music setup."""
     print_header("YOUTUBE MUSIC SETUP", "Simple 2-minute browser authentication")
-    
-    print_box([
-        "OPTION 1 - Easiest (Recommended):",
-        "  Run: python setup_browser_auth.py",
-        "",
-        "OPTION 2 - Quick (if you know what you're doing):",
-        "  1. Go to https://music.youtube.com (signed in)",
-        "  2. Press F12 > Network tab > filter 'browse'",
-        "  3. Click 'Library' in YouTube Music",
-        "  4. Find a POST request to 'browse?...'",
-        "  5. Copy headers: Chrome (Copy as cURL bash) | Firefox (Copy Request Headers)"
-    ])
-    print()
+    safe_print(_YTMUSIC_SETUP_TEXT)
     
     choice = input("Continue with quick setup here? (y/n): ").strip().lower()
     
@@ -159,17 +291,22 @@ def setup_ytmusic():
     
     
     # Use shared input helper
-    from utils.ui import get_multiline_input
-    headers_text = get_multiline_input("Paste your request headers below (press Enter twice when done):")
+    headers_text = get_multiline_input("Paste your request headers below:")
     
     if not headers_text or len(headers_text) < 100:
         print_error("Headers too short or empty. Cancelled.")
         pause()
         return False
     
+    has_cookie, from_ytmusic = precheck_headers_text(headers_text)
+    if not has_cookie:
+        print_error("No cookie found in the pasted headers. Cancelled.")
+        pause()
+        return False
+    if not from_ytmusic:
+        print_warning("These don't look like music.youtube.com headers (youtube.com won't work).")
+    
     try:
-        from utils.auth_helper import parse_headers, validate_headers, save_browser_auth
-        
         headers = parse_headers(headers_text)
         is_valid, missing = validate_headers(headers)
 
@@ -190,16 +327,22 @@ def setup_ytmusic():
 
         # Save to file
         save_browser_auth(headers, 'browser_auth.json')
+        invalidate_configured_cache()
+        reset_clients()
 
         print_success("YouTube Music browser auth saved!")
         
-        # Test connection
-        print_info("Testing YouTube Music connection...")
-        success, msg, error_type = test_ytmusic_connection()
-        if success:
-            print_success(msg)
-        else:
-            print_warning(f"Connection test: {msg}")
+        # Local check only; the network probe is opt-in
+        cookie_ok, cookie_msg = check_auth_cookie(headers)
+        if not cookie_ok:
+            print_warning(cookie_msg)
+        elif VERIFY_NETWORK:
+            print_info("Testing YouTube Music connection...")
+            success, msg, error_type = test_ytmusic_connection()
+            if success:
+                print_success(msg)
+            else:
+                print_warning(f"Connection test: {msg}")
         
         pause()
         return True
@@ -219,16 +362,16 @@ def manage_playlists():
     while True:
         print_header("PLAYLIST MANAGEMENT", "Manage your playlist mappings")
         
-        mapping = get_playlist_mapping()
+        mapping_items = get_playlist_mapping_items()
         
-        if mapping:
-            print(f"Current mappings ({len(mapping)} total):")
+        if mapping_items:
+            print(f"Current mappings ({len(mapping_items)} total):")
             print_divider()
-            for i, (sp_id, yt_id) in enumerate(list(mapping.items())[:5], 1):
+            for i, (sp_id, yt_id) in enumerate(mapping_items[:5], 1):
                 safe_print(f"  {i}. {Colors.DIM}Spotify:{Colors.RESET} {sp_id[:30]}...")
                 safe_print(f"     {Colors.DIM}YTMusic:{Colors.RESET} {yt_id}")
-            if len(mapping) > 5:
-                print(f"  ... and {len(mapping) - 5} more")
+            if len(mapping_items) > 5:
+                print(f"  ... and {len(mapping_items) - 5} more")
             print()
         else:
             print_warning("No playlists configured yet.")
@@ -242,9 +385,10 @@ def manage_playlists():
             "View Spotify playlists",
             "View YouTube Music playlists",
             "Create YouTube Music playlist",
+            "View Spotify and YouTube Music playlists together",
         ])
         
-        choice = get_choice(7)
+        choice = get_choice(8)
         
         if choice == 0:
             break
@@ -262,6 +406,8 @@ def manage_playlists():
             view_ytmusic_playlists()
         elif choice == 7:
             create_ytmusic_playlist_interactive()
+        elif choice == 8:
+            view_both_playlists()
 
 
 def add_playlist_mapping():
@@ -308,14 +454,7 @@ def add_playlist_mapping_interactive():
     print_info("Fetching your Spotify playlists...")
     try:
         sp = get_spotify_client()
-        spotify_playlists = []
-        results = sp.current_user_playlists(limit=50)
-        while results:
-            spotify_playlists.extend(results['items'])
-            if results['next']:
-                results = sp.next(results)
-            else:
-                break
+        spotify_playlists = get_all_spotify_playlists(sp)
     except Exception as e:
         print_error(f"Failed to fetch Spotify playlists: {e}")
         pause()
@@ -324,8 +463,7 @@ def add_playlist_mapping_interactive():
     # Fetch YouTube Music playlists
     print_info("Fetching your YouTube Music playlists...")
     try:
-        ytm = get_ytmusic_client()
-        yt_playlists = ytm.get_library_playlists(limit=100)
+        yt_playlists = get_ytmusic_library_playlists(limit=100)
     except Exception as e:
         print_error(f"Failed to fetch YouTube Music playlists: {e}")
         pause()
@@ -419,9 +557,9 @@ def add_playlist_mapping_interactive():
     
     # Add to config using the safe config_updater
     try:
-        from config_updater import append_playlist_mappings
         new_mappings = {spotify_id: ytmusic_id}
         added = append_playlist_mappings(new_mappings)
+        invalidate_config_cache()
         
         if added > 0:
             print_success("Mapping added!")
@@ -430,7 +568,6 @@ def add_playlist_mapping_interactive():
             print_error("Failed to add mapping to config.py")
     except Exception as e:
         print_error(f"Error: {e}")
-        import traceback
         traceback.print_exc()
     
     pause()
@@ -462,27 +599,15 @@ def add_playlist_mapping_manual():
     try:
         ensure_config_exists()
         
-        with open("config.py", "r", encoding="utf-8") as f:
-            content = f.read()
-        
-        import re
-        pattern = r'(PLAYLIST_MAPPING = \{[^}]*)'
-        match = re.search(pattern, content, re.DOTALL)
+        added = append_playlist_mappings({spotify_id: ytmusic_id})
+        invalidate_config_cache()
         
-        if match:
-            old_mapping = match.group(1)
-            new_entry = f'\n    "{spotify_id}": "{ytmusic_id}",'
-            new_mapping = old_mapping + new_entry
-            content = content.replace(old_mapping, new_mapping)
-            
-            with open("config.py", "w", encoding="utf-8") as f:
-                f.write(content)
-            
+        if added > 0:
             print_success("Mapping added!")
             print(f"   Spotify: {spotify_id}")
             print(f"   YT Music: {ytmusic_id}")
         else:
-            print_error("Could not find PLAYLIST_MAPPING in config.py")
+            print_error("Failed to add mapping to config.py")
     except Exception as e:
         print_error(str(e))
     
@@ -491,8 +616,8 @@ def add_playlist_mapping_manual():
 
 def remove_playlist_mapping():
     """Remove a playlist mapping."""
-    mapping = get_playlist_mapping()
-    if not mapping:
+    mapping_items = get_playlist_mapping_items()
+    if not mapping_items:
         print_warning("No mappings to remove.")
         pause()
         return
@@ -507,7 +632,7 @@ def remove_playlist_mapping():
         sp = get_spotify_client()
         ytm = get_ytmusic_client()
         
-        for sp_id, yt_id in mapping.items():
+        for sp_id, yt_id in mapping_items:
             # Get Spotify name
             try:
                 sp_playlist = sp.playlist(sp_id, fields="name")
@@ -536,7 +661,7 @@ def remove_playlist_mapping():
     except Exception as e:
         print_error(f"Error fetching names: {e}")
         print()
-        items = [(sp_id, yt_id, sp_id[:30], yt_id[:30]) for sp_id, yt_id in mapping.items()]
+        items = [(sp_id, yt_id, sp_id[:30], yt_id[:30]) for sp_id, yt_id in mapping_items]
         for i, (sp_id, _, _, _) in enumerate(items, 1):
             print(f"  [{i}] {sp_id[:40]}...")
         print("  [0] Cancel")
@@ -549,15 +674,8 @@ def remove_playlist_mapping():
     sp_id_to_remove, _, sp_name, yt_name = items[choice - 1]
     
     try:
-        with open("config.py", "r", encoding="utf-8") as f:
-            content = f.read()
-        
-        import re
-        pattern = rf'\s*"{re.escape(sp_id_to_remove)}"\s*:\s*"[^"]*"\s*,?\s*\n?'
-        content = re.sub(pattern, '\n', content)
-        
-        with open("config.py", "w", encoding="utf-8") as f:
-            f.write(content)
+        remove_playlist_mappings([sp_id_to_remove])
+        invalidate_config_cache()
         
         print_success(f"Removed: {sp_name}")
     except Exception as e:
@@ -568,6 +686,7 @@ def remove_playlist_mapping():
 
 def check_ytmusic_headers_status():
     """Check if YouTube Music headers are still valid."""
+    mark_menu_dirty()
     print_header("YOUTUBE MUSIC HEADERS STATUS", "Check authentication validity")
     
     if not check_ytmusic_configured():
@@ -580,7 +699,6 @@ def check_ytmusic_headers_status():
     print()
     
     try:
-        from utils.ytmusic_validator import check_ytmusic_auth
         is_valid, message, error_type = check_ytmusic_auth()
         
         print_divider()
@@ -622,7 +740,6 @@ def check_ytmusic_headers_status():
         
     except Exception as e:
         print_error(f"Error checking headers: {e}")
-        import traceback
         traceback.print_exc()
     
     pause()
@@ -630,6 +747,7 @@ def check_ytmusic_headers_status():
 
 def validate_mappings():
     """Validate playlist mappings and find broken ones."""
+    mark_menu_dirty()
     print_header("VALIDATE MAPPINGS", "Check for broken YouTube Music playlists")
     
     mapping = get_playlist_mapping()
@@ -648,7 +766,6 @@ def validate_mappings():
     
     try:
         # First check authentication
-        from utils.ytmusic_validator import check_ytmusic_auth
         auth_valid, auth_msg, error_type = check_ytmusic_auth()
         
         if not auth_valid and error_type in ('expired', 'missing'):
@@ -667,7 +784,6 @@ def validate_mappings():
         
         # Auth is valid, proceed with validation
         ytm = get_ytmusic_client()
-        from utils.ytmusic_validator import validate_all_playlists
         
         print_info("Validating playlist access...")
         results = validate_all_playlists(ytm, mapping)
@@ -700,9 +816,9 @@ def validate_mappings():
             
             confirm = input("Remove these broken mappings from config? (y/n): ").strip().lower()
             if confirm == 'y':
-                from config_updater import remove_playlist_mappings
                 sp_ids_to_remove = [sp_id for sp_id, _ in results['missing']]
                 removed = remove_playlist_mappings(sp_ids_to_remove)
+                invalidate_config_cache()
                 print_success(f"Removed {removed} broken mappings!")
                 print_info("Backup saved as config.py.backup")
             else:
@@ -719,12 +835,42 @@ def validate_mappings():
         
     except Exception as e:
         print_error(str(e))
-        import traceback
         traceback.print_exc()
     
     pause()
 
 
+def _spotify_playlist_lines(items) -> list:
+    """Format Spotify playlist objects for the playlist views."""
+    lines = []
+    for pl in items:
+        lines.append(f"  {Colors.BOLD}{pl['name']}{Colors.RESET}")
+        lines.append(f"  {Colors.DIM}ID: {pl['id']}{Colors.RESET}")
+        lines.append("")
+    return lines
+
+
+def _ytmusic_playlist_lines(playlists) -> list:
+    """Format YouTube Music library playlists for the playlist views."""
+    lines = []
+    for pl in playlists:
+        lines.append(f"  {Colors.BOLD}{pl.get('title', 'Unknown')}{Colors.RESET}")
+        lines.append(f"  {Colors.DIM}ID: {pl.get('playlistId', 'N/A')}{Colors.RESET}")
+        lines.append("")
+    return lines
+
+
+def _report_ytmusic_fetch_error(e: Exception):
+    """Print a YouTube Music request error, spelling out expired headers."""
+    error_str = str(e).lower()
+    if '401' in error_str or 'unauthorized' in error_str or 'not signed in' in error_str:
+        mark_menu_dirty()
+        print_error("You are NOT signed in! Your authentication headers have expired.")
+        print_info("Please run: python setup_browser_auth.py to get fresh headers")
+    else:
+        print_error(str(e))
+
+
 def view_spotify_playlists():
     """View user's Spotify playlists."""
     print_header("YOUR SPOTIFY PLAYLISTS")
@@ -736,10 +882,9 @@ def view_spotify_playlists():
         print(f"Found {len(playlists['items'])} playlists:")
         print_divider()
         
-        for pl in playlists['items']:
-            safe_print(f"  {Colors.BOLD}{pl['name']}{Colors.RESET}")
-            print(f"  {Colors.DIM}ID: {pl['id']}{Colors.RESET}")
-            print()
+        lines = _spotify_playlist_lines(playlists['items'])
+        if lines:
+            safe_print("\n".join(lines))
     except Exception as e:
         print_error(str(e))
     
@@ -759,7 +904,6 @@ def view_ytmusic_playlists():
     
     # Verify auth is valid, not just that file exists
     try:
-        from utils.ytmusic_validator import check_ytmusic_auth
         is_valid, message, error_type = check_ytmusic_auth()
         if not is_valid:
             if error_type == 'expired':
@@ -774,26 +918,64 @@ def view_ytmusic_playlists():
         print_warning(f"Could not verify auth: {e}")
     
     try:
-        ytm = get_ytmusic_client()
-        playlists = ytm.get_library_playlists(limit=20)
+        playlists = get_ytmusic_library_playlists(limit=20)
         
         if playlists:
             print(f"Found {len(playlists)} playlists:")
             print_divider()
             
-            for pl in playlists:
-                safe_print(f"  {Colors.BOLD}{pl.get('title', 'Unknown')}{Colors.RESET}")
-                print(f"  {Colors.DIM}ID: {pl.get('playlistId', 'N/A')}{Colors.RESET}")
-                print()
+            safe_print("\n".join(_ytmusic_playlist_lines(playlists)))
         else:
             print_warning("No playlists found.")
     except Exception as e:
-        error_str = str(e).lower()
-        if '401' in error_str or 'unauthorized' in error_str or 'not signed in' in error_str:
-            print_error("You are NOT signed in! Your authentication headers have expired.")
-            print_info("Please run: python setup_browser_auth.py to get fresh headers")
-        else:
-            print_error(str(e))
+        _report_ytmusic_fetch_error(e)
+    
+    pause()
+
+
+def view_both_playlists():
+    """View Spotify and YouTube Music playlists, fetching both at once."""
+    print_header("YOUR PLAYLISTS", "Spotify and YouTube Music")
+    
+    ytmusic_ok = check_ytmusic_configured()
+    print_info("Fetching playlists...")
+    
+    # Both fetches are network-bound, so overlap them
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        sp_future = executor.submit(
+            lambda: get_spotify_client().current_user_playlists(limit=20)['items']
+        )
+        yt_future = executor.submit(
+            get_ytmusic_library_playlists, 20
+        ) if ytmusic_ok else None
+    
+    print()
+    print(f"{Colors.BOLD}SPOTIFY{Colors.RESET}")
+    print_divider()
+    try:
+        items = sp_future.result()
+        print(f"Found {len(items)} playlists:")
+        if items:
+            safe_print("\n".join(_spotify_playlist_lines(items)))
+    except Exception as e:
+        print_error(str(e))
+    
+    print()
+    print(f"{Colors.BOLD}YOUTUBE MUSIC{Colors.RESET}")
+    print_divider()
+    if yt_future is None:
+        print_error("YouTube Music not configured!")
+        print_info("Please run: python setup_browser_auth.py")
+    else:
+        try:
+            playlists = yt_future.result()
+            if playlists:
+                print(f"Found {len(playlists)} playlists:")
+                safe_print("\n".join(_ytmusic_playlist_lines(playlists)))
+            else:
+                print_warning("No playlists found.")
+        except Exception as e:
+            _report_ytmusic_fetch_error(e)
     
     pause()
 
@@ -811,7 +993,6 @@ def create_ytmusic_playlist_interactive():
     
     # Verify auth is valid, not just that file exists
     try:
-        from utils.ytmusic_validator import check_ytmusic_auth
         is_valid, message, error_type = check_ytmusic_auth()
         if not is_valid:
             if error_type == 'expired':
@@ -856,14 +1037,10 @@ def create_ytmusic_playlist_interactive():
     try:
         from create_ytmusic_playlist import create_playlist
         playlist_id = create_playlist(playlist_name, description, privacy_status)
+        invalidate_library_cache()
         print_success(f"Created! ID: {playlist_id}")
     except Exception as e:
-        error_str = str(e).lower()
-        if '401' in error_str or 'unauthorized' in error_str or 'not signed in' in error_str:
-            print_error("You are NOT signed in! Your authentication headers have expired.")
-            print_info("Please run: python setup_browser_auth.py to get fresh headers")
-        else:
-            print_error(str(e))
+        _report_ytmusic_fetch_error(e)
     
     pause()
 
@@ -916,29 +1093,27 @@ def auto_create_ytm_playlists(dry_run=False):
         pause()
         return
     
+    ytm_executor = None
     try:
-        import importlib
-        import config
-        importlib.reload(config)
-        from config_updater import append_playlist_mappings
+        snapshot = load_config_snapshot()
+        
+        # Warm up YouTube Music in the background while Spotify is fetched
+        # (real runs only); nothing waits on it until creation is confirmed
+        ytm_future = None
+        if not dry_run:
+            ytm_executor = ThreadPoolExecutor(max_workers=1)
+            ytm_future = ytm_executor.submit(get_ytmusic_client)
         
         print_info("Connecting to Spotify...")
         sp = get_spotify_client()
         
         print_info("Fetching your Spotify playlists...")
-        all_playlists = []
-        results = sp.current_user_playlists(limit=50)
-        while results:
-            all_playlists.extend(results['items'])
-            if results['next']:
-                results = sp.next(results)
-            else:
-                break
+        all_playlists = get_all_spotify_playlists(sp)
         
         print_success(f"Found {len(all_playlists)} Spotify playlists")
         
         # Get current mapping
-        current_mapping = getattr(config, 'PLAYLIST_MAPPING', {}).copy()
+        current_mapping = snapshot.mapping
         
         # Find unmapped playlists
         unmapped = [pl for pl in all_playlists 
@@ -968,26 +1143,43 @@ def auto_create_ytm_playlists(dry_run=False):
                 return
             
             print_info("Connecting to YouTube Music...")
-            ytm = get_ytmusic_client()
+            ytm = ytm_future.result()
             
-            new_mappings = {}
-            for pl in unmapped:
-                try:
-                    safe_print(f"  Creating: {pl['name']}")
-                    yt_id = ytm.create_playlist(
+            # Creation is one network round trip per playlist - run a few at once
+            privacy = 'PRIVATE' if snapshot.ytmusic_private else 'PUBLIC'
+            created = {}
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = {
+                    executor.submit(
+                        ytm.create_playlist,
                         title=pl['name'],
-                        description=f"Synced from Spotify",
-                        privacy_status='PRIVATE' if getattr(config, 'YTMUSIC_PLAYLIST_PRIVATE', True) else 'PUBLIC'
-                    )
-                    new_mappings[pl['id']] = yt_id
-                    print_success(f"    Created (ID: {yt_id})")
-                except Exception as e:
-                    print_error(f"    Failed: {e}")
+                        description="Synced from Spotify",
+                        privacy_status=privacy
+                    ): pl
+                    for pl in unmapped
+                }
+                for future in as_completed(futures):
+                    pl = futures[future]
+                    try:
+                        yt_id = future.result()
+                        created[pl['id']] = yt_id
+                        safe_print(f"  Created: {pl['name']}")
+                        print_success(f"    ID: {yt_id}")
+                    except Exception as e:
+                        safe_print(f"  Creating: {pl['name']}")
+                        print_error(f"    Failed: {e}")
+            
+            if created:
+                invalidate_library_cache()
+            
+            # Keep config.py entries in Spotify library order
+            new_mappings = {pl['id']: created[pl['id']] for pl in unmapped if pl['id'] in created}
             
             if new_mappings:
                 print_info("Updating config.py...")
                 try:
                     added = append_playlist_mappings(new_mappings)
+                    invalidate_config_cache()
                     print_success(f"Added {added} new mappings to config.py!")
                 except Exception as e:
                     print_error(f"Failed to update config: {e}")
@@ -996,8 +1188,10 @@ def auto_create_ytm_playlists(dry_run=False):
         
     except Exception as e:
         print_error(str(e))
-        import traceback
         traceback.print_exc()
+    finally:
+        if ytm_executor:
+            ytm_executor.shutdown(wait=False)  # Don't block on an unused warm-up
     
     pause()
 
@@ -1008,6 +1202,7 @@ def auto_create_ytm_playlists(dry_run=False):
 
 def run_sync(dry_run=False):
     """Run the playlist sync."""
+    mark_menu_dirty()
     mode = "(DRY RUN)" if dry_run else ""
     print_header(f"RUNNING SYNC {mode}")
     
@@ -1023,6 +1218,10 @@ def run_sync(dry_run=False):
     
     try:
         from sync_playlists import sync_playlists
+        # sync_playlists reads the shared config module, which the ast-based
+        # mapping reads never refresh; reload it in place so edits made in
+        # this session are seen
+        maybe_reload_config(force=True)
         sync_playlists(dry_run=dry_run)
     except Exception as e:
         print_error(f"Error during sync: {e}")
@@ -1034,37 +1233,48 @@ def run_sync(dry_run=False):
 # MAIN MENU
 # =============================================================================
 
+def _check_ytmusic_status():
+    """
+    Check YTMusic header validity for the status panel.
+    
+    Returns:
+        (is_valid, message, definitive) - definitive is False when the check
+        couldn't reach a verdict (e.g. network trouble), so it isn't cached
+    """
+    try:
+        is_valid, message, error_type = check_ytmusic_auth()
+        if is_valid:
+            return True, "Valid", True
+        elif error_type == 'expired':
+            return False, "*** EXPIRED - REFRESH HEADERS ***", True
+        elif error_type == 'missing':
+            return False, "*** NOT CONFIGURED ***", True
+        else:
+            return False, "Unknown error", False
+    except Exception:
+        return True, "Unknown", False  # Assume valid if can't check
+
+
 def show_status():
     """Display current setup status."""
-    spotify_ok = check_spotify_configured()
-    ytmusic_ok = check_ytmusic_configured()
+    spotify_ok, ytmusic_ok = get_configured_status()
     playlists = get_playlist_mapping()
     
-    # Check YTMusic header validity
+    # Check YTMusic header validity (reused across redraws until marked dirty)
     ytmusic_auth_valid = False
     ytmusic_status_msg = "Not configured"
     if ytmusic_ok:
-        try:
-            from utils.ytmusic_validator import check_ytmusic_auth
-            is_valid, message, error_type = check_ytmusic_auth()
-            ytmusic_auth_valid = is_valid
-            if is_valid:
-                ytmusic_status_msg = "Valid"
-            elif error_type == 'expired':
-                ytmusic_status_msg = "*** EXPIRED - REFRESH HEADERS ***"
-            elif error_type == 'missing':
-                ytmusic_status_msg = "*** NOT CONFIGURED ***"
-            else:
-                ytmusic_status_msg = "Unknown error"
-        except:
-            ytmusic_status_msg = "Unknown"
-            ytmusic_auth_valid = True  # Assume valid if can't check
+        auth_key = _mtime_ns("browser_auth.json")
+        if _MENU_STATUS["dirty"] or _MENU_STATUS["key"] != auth_key:
+            is_valid, message, definitive = _check_ytmusic_status()
+            _MENU_STATUS["ytmusic"] = (is_valid, message)
+            _MENU_STATUS["key"] = auth_key
+            _MENU_STATUS["dirty"] = not definitive  # Retry inconclusive checks
+        ytmusic_auth_valid, ytmusic_status_msg = _MENU_STATUS["ytmusic"]
     
     # Get last sync time
     last_sync_msg = "Never"
     try:
-        import os
-        from datetime import datetime
         if os.path.exists("sync_log.txt"):
             with open("sync_log.txt", "r", encoding="utf-8") as f:
                 lines = f.readlines()
@@ -1120,7 +1330,8 @@ def show_status():
 def show_welcome_if_needed():
     """Show welcome screen for first-time users."""
     # Check if this is first run (no credentials configured)
-    if not check_spotify_configured() or not check_ytmusic_configured():
+    spotify_ok, ytmusic_ok = get_configured_status()
+    if not spotify_ok or not ytmusic_ok:
         print_header("WELCOME TO SPOTIFY → YOUTUBE MUSIC SYNC!", "Your music, synced effortlessly")
         
         print_box([
@@ -1134,9 +1345,6 @@ def show_welcome_if_needed():
         ], "Getting Started")
         print()
         
-        spotify_ok = check_spotify_configured()
-        ytmusic_ok = check_ytmusic_configured()
-        
         print("Setup Status:")
         print_divider()
         if not spotify_ok:
@@ -1216,7 +1424,8 @@ def main_menu():
 # =============================================================================
 
 if __name__ == "__main__":
+    make_stdout_lenient()
     try:
         main_menu()
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, EOFError):  # Ctrl-C, or piped input ran out
         print("\n\nGoodbye!")
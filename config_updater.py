@@ -6,8 +6,11 @@ formatting and creating backups.
 """
 
 import os
-import re
+import sys
+import ast
+import json
 import shutil
+import importlib
 from typing import Dict, List, Optional
 
 
@@ -42,6 +45,33 @@ def get_config_path() -> str:
     return os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.py")
 
 
+def maybe_reload_config(force: bool = False):
+    """
+    Return the config module, re-executing config.py only if it changed.
+    
+    The mtime seen at the last (re)load is stored on the module itself, so
+    every caller shares it. Use force=True right after writing config.py
+    on filesystems with coarse mtime resolution.
+    
+    Returns:
+        The (possibly reloaded) config module
+    """
+    fresh = "config" not in sys.modules
+    import config
+    
+    try:
+        mtime = os.stat(config.__file__).st_mtime_ns
+    except OSError:
+        return config
+    
+    if fresh:
+        config._last_mtime = mtime
+    elif force or getattr(config, "_last_mtime", None) != mtime:
+        config = importlib.reload(config)
+        config._last_mtime = mtime
+    return config
+
+
 def create_backup(config_path: str) -> str:
     """
     Create a backup of config.py.
@@ -57,6 +87,29 @@ def create_backup(config_path: str) -> str:
     return backup_path
 
 
+def write_config_atomic(content, config_path: Optional[str] = None):
+    """
+    Replace config.py in one step so it is never left half-written.
+    
+    The new content goes to config.py.tmp first and is then renamed over
+    config.py with os.replace (atomic on POSIX and Windows).
+    
+    Args:
+        content: New file content (str is written as UTF-8)
+        config_path: Path to the config file (defaults to get_config_path())
+    """
+    config_path = config_path or get_config_path()
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    
+    tmp_path = config_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    if os.path.exists(config_path):
+        shutil.copymode(config_path, tmp_path)
+    os.replace(tmp_path, config_path)
+
+
 def rollback_config(config_path: str) -> bool:
     """
     Rollback config.py from backup.
@@ -74,6 +127,164 @@ def rollback_config(config_path: str) -> bool:
     return False
 
 
+def _find_mapping_node(tree: ast.Module) -> Optional[ast.Assign]:
+    """Return the top-level `PLAYLIST_MAPPING = ...` assignment, if any."""
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1 and
+                isinstance(node.targets[0], ast.Name) and
+                node.targets[0].id == "PLAYLIST_MAPPING"):
+            return node
+    return None
+
+
+def _render_literal(value) -> str:
+    """Render a mapping key/value the way config.py writes them ("double quoted")."""
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    return repr(value)
+
+
+def read_playlist_mapping(config_path: Optional[str] = None) -> Dict[str, str]:
+    """
+    Parse PLAYLIST_MAPPING from config.py without executing the module.
+    
+    Raises:
+        ValueError: If PLAYLIST_MAPPING is missing or not a plain dict literal
+    """
+    config_path = config_path or get_config_path()
+    with open(config_path, "rb") as f:
+        node = _find_mapping_node(ast.parse(f.read()))
+    
+    if node is None or not isinstance(node.value, ast.Dict):
+        raise ValueError("Could not find PLAYLIST_MAPPING dictionary in config.py")
+    return ast.literal_eval(node.value)
+
+
+def read_config_literals(names, config_path: Optional[str] = None) -> dict:
+    """
+    Read top-level literal assignments straight from config.py source.
+    
+    Unlike importing (or reloading) config, nothing in the file is executed.
+    
+    Args:
+        names: Variable names to look for
+        config_path: Path to the config file (defaults to get_config_path())
+    
+    Returns:
+        Dict of {name: value} for the names found
+    
+    Raises:
+        ValueError: If one of the names is assigned something other than a
+            plain literal
+    """
+    config_path = config_path or get_config_path()
+    with open(config_path, "rb") as f:
+        tree = ast.parse(f.read())
+    
+    values = {}
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1 and
+                isinstance(node.targets[0], ast.Name) and
+                node.targets[0].id in names):
+            values[node.targets[0].id] = ast.literal_eval(node.value)
+    return values
+
+
+def _rewrite_mapping(new_mapping: Dict[str, str], config_path: Optional[str] = None):
+    """
+    Replace the PLAYLIST_MAPPING dict in config.py with `new_mapping`.
+    
+    The dict is located with `ast`, and only its source span is rewritten:
+    everything outside it is left byte-for-byte. Inside it, comment lines and
+    untouched entries keep their original text; removed entries are dropped
+    and new ones are appended at the end.
+    
+    Raises:
+        ValueError: If PLAYLIST_MAPPING is missing or not a plain dict literal
+    """
+    config_path = config_path or get_config_path()
+    with open(config_path, "rb") as f:
+        source = f.read()
+    
+    node = _find_mapping_node(ast.parse(source))
+    if node is None or not isinstance(node.value, ast.Dict):
+        raise ValueError("Could not find PLAYLIST_MAPPING dictionary in config.py")
+    
+    old_mapping = ast.literal_eval(node.value)
+    dict_node = node.value
+    # (key node, value node, key) - each key literal is evaluated once
+    entries = [(k, v, ast.literal_eval(k)) for k, v in zip(dict_node.keys, dict_node.values)]
+    
+    lines = source.splitlines(keepends=True)
+    first, last = dict_node.lineno - 1, dict_node.end_lineno - 1
+    newline = b"\r\n" if lines[first].endswith(b"\r\n") else b"\n"
+    
+    def render(key):
+        entry = f"    {_render_literal(key)}: {_render_literal(new_mapping[key])},"
+        return entry.encode("utf-8") + newline
+    
+    # Entries sharing a line with the braces (e.g. `{"a": "b"}`) can't be
+    # kept line-by-line, so the whole dict body gets re-rendered
+    compact = first == last or any(
+        k.lineno - 1 == first or v.end_lineno - 1 == last for k, v, _ in entries
+    )
+    
+    body = []
+    emitted = set()
+    if compact:
+        head = lines[first][:dict_node.col_offset] + b"{" + newline
+        tail = lines[last][dict_node.end_col_offset - 1:]
+    else:
+        head, tail = lines[first], lines[last]
+        
+        owners = {}
+        for entry in entries:
+            k, v, _ = entry
+            for line_no in range(k.lineno - 1, v.end_lineno):
+                owners.setdefault(line_no, []).append(entry)
+        
+        for line_no in range(first + 1, last):
+            owned = owners.get(line_no)
+            if not owned:
+                body.append(lines[line_no])  # Comments and blank lines
+                continue
+            
+            keys = [key for _, _, key in owned]
+            unchanged = all(
+                k.lineno == v.end_lineno == line_no + 1 and
+                key in new_mapping and new_mapping[key] == old_mapping[key]
+                for k, v, key in owned
+            )
+            if unchanged:
+                line = lines[line_no]
+                end = owned[-1][1].end_col_offset
+                if not line[end:].lstrip().startswith(b","):
+                    line = line[:end] + b"," + line[end:]
+                body.append(line)
+                emitted.update(keys)
+            else:
+                for key in keys:
+                    if key in new_mapping and key not in emitted:
+                        body.append(render(key))
+                        emitted.add(key)
+        
+        while body and not body[-1].strip():
+            body.pop()
+    
+    for key in new_mapping:
+        if key not in emitted:
+            body.append(render(key))
+    
+    new_source = b"".join(lines[:first]) + head + b"".join(body) + tail + b"".join(lines[last + 1:])
+    
+    # Never write a config that doesn't round-trip
+    check = _find_mapping_node(ast.parse(new_source))
+    if check is None or ast.literal_eval(check.value) != new_mapping:
+        raise ValueError("Failed to rewrite PLAYLIST_MAPPING in config.py")
+    
+    write_config_atomic(new_source, config_path)
+
+
 def remove_playlist_mappings(spotify_ids_to_remove: List[str]) -> int:
     """
     Remove specific playlist mappings from config.py.
@@ -86,6 +297,7 @@ def remove_playlist_mappings(spotify_ids_to_remove: List[str]) -> int:
     
     Raises:
         FileNotFoundError: If config.py doesn't exist
+        ValueError: If PLAYLIST_MAPPING not found in config.py
     """
     config_path = get_config_path()
     
@@ -95,26 +307,17 @@ def remove_playlist_mappings(spotify_ids_to_remove: List[str]) -> int:
     if not spotify_ids_to_remove:
         return 0
     
-    # Create backup
-    create_backup(config_path)
-    
-    with open(config_path, "r", encoding="utf-8") as f:
-        content = f.read()
-    
-    removed_count = 0
-    for sp_id in spotify_ids_to_remove:
-        sp_id = sp_id.strip()
-        # Match the line with this Spotify ID
-        pattern = rf'\s*"{re.escape(sp_id)}"\s*:\s*"[^"]*"\s*,?\s*\n?'
-        if re.search(pattern, content):
-            content = re.sub(pattern, '\n', content)
-            removed_count += 1
+    current = read_playlist_mapping(config_path)
+    to_remove = {sp_id.strip() for sp_id in spotify_ids_to_remove}
+    updated = {sp_id: yt_id for sp_id, yt_id in current.items() if sp_id not in to_remove}
     
-    # Clean up any double newlines
-    content = re.sub(r'\n{3,}', '\n\n', content)
+    removed_count = len(current) - len(updated)
+    if removed_count == 0:
+        return 0
     
-    with open(config_path, "w", encoding="utf-8") as f:
-        f.write(content)
+    # Create backup
+    create_backup(config_path)
+    _rewrite_mapping(updated, config_path)
     
     return removed_count
 
@@ -146,27 +349,11 @@ def append_playlist_mappings(new_mappings: Dict[str, str]) -> int:
     if not new_mappings:
         return 0
     
-    # Create backup before any modifications
-    create_backup(config_path)
-    
-    with open(config_path, "r", encoding="utf-8") as f:
-        content = f.read()
-    
-    # Find PLAYLIST_MAPPING dictionary using a more robust pattern
-    # This handles multi-line dictionaries with comments
-    pattern = r'(PLAYLIST_MAPPING\s*=\s*\{)(.*?)(\})'
-    match = re.search(pattern, content, re.DOTALL)
-    
-    if not match:
-        raise ValueError("Could not find PLAYLIST_MAPPING dictionary in config.py")
-    
-    header = match.group(1)
-    existing_entries = match.group(2)
-    footer = match.group(3)
+    current = read_playlist_mapping(config_path)
+    updated = dict(current)
     
     # Count how many we actually add
     added_count = 0
-    new_entries_str = ""
     
     for sp_id, yt_id in new_mappings.items():
         # Validate IDs
@@ -182,27 +369,19 @@ def append_playlist_mappings(new_mappings: Dict[str, str]) -> int:
             continue
         
         # Check if already exists to avoid duplicates
-        # Use regex to find if it exists as an active (uncommented) mapping
-        # This prevents collisions with comments or inactive mappings
-        id_pattern = rf'^\s*"{re.escape(sp_id)}"\s*:'
-        if not re.search(id_pattern, existing_entries, re.MULTILINE):
-            new_entries_str += f'\n    "{sp_id}": "{yt_id}",'
-            added_count += 1
-        else:
+        if sp_id in updated:
             print(f"  Note: Mapping for {sp_id} already exists in config.py")
+            continue
+        
+        updated[sp_id] = yt_id
+        added_count += 1
     
-    if not new_entries_str:
+    if added_count == 0:
         return 0  # Nothing to add
     
-    # Ensure proper formatting - remove trailing whitespace from existing
-    existing_entries = existing_entries.rstrip()
-    
-    # Combine everything
-    updated_mapping = f"{header}{existing_entries}{new_entries_str}\n{footer}"
-    new_content = content[:match.start()] + updated_mapping + content[match.end():]
-    
-    with open(config_path, "w", encoding="utf-8") as f:
-        f.write(new_content)
+    # Create backup before any modifications
+    create_backup(config_path)
+    _rewrite_mapping(updated, config_path)
     
     return added_count
 
@@ -239,13 +418,21 @@ def get_current_mappings() -> Dict[str, str]:
     """
     Read and return the current PLAYLIST_MAPPING from config.py.
     
+    The dict literal is parsed from source; the module is only executed
+    when the mapping isn't a plain literal.
+    
     Returns:
         Dictionary of current mappings, or empty dict if not found.
     """
     try:
-        import importlib
-        import config
-        importlib.reload(config)
+        return dict(read_playlist_mapping())
+    except (OSError, SyntaxError):
+        return {}
+    except ValueError:
+        pass
+    
+    try:
+        config = maybe_reload_config()
         if hasattr(config, 'PLAYLIST_MAPPING'):
             return dict(config.PLAYLIST_MAPPING)
     except Exception:
@@ -12,79 +12,188 @@ import sys
 # Add current directory to path for local imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from utils.auth_helper import parse_headers, validate_headers, save_browser_auth
+from utils.auth_helper import (
+    precheck_headers_text, parse_headers, validate_headers,
+    check_auth_cookie, save_browser_auth
+)
 from utils.ui import (
     clear_screen, print_header, print_divider, print_success, 
     print_error, print_warning, print_info, get_multiline_input,
-    Colors, safe_print
+    pause, make_stdout_lenient, Colors, safe_print
 )
 
+# Step-by-step browser instructions, built once
+_INSTRUCTIONS = "\n".join([
+    "This is EASY! Just follow the steps for your browser:",
+    "",
+    "-" * 70,
+    "STEP 1: Open YouTube Music and Sign In",
+    "-" * 70,
+    "  1. Go to: https://music.youtube.com",
+    "  2. Make sure you're SIGNED IN with your Google account",
+    "",
+    "-" * 70,
+    "STEP 2: Open Developer Tools",
+    "-" * 70,
+    "  • Press F12 (or Right-click → Inspect)",
+    "  • Click the 'Network' tab at the top",
+    "",
+    "-" * 70,
+    "STEP 3: Find an Authenticated Request",
+    "-" * 70,
+    "  • In the Network tab filter box, type: browse",
+    "  • Click on 'Library' in YouTube Music (left sidebar)",
+    "  • Look for a POST request with these details:",
+    "      ✓ Status: 200",
+    "      ✓ Method: POST",
+    "      ✓ Name/File: browse?...",
+    "",
+    "-" * 70,
+    "STEP 4: Copy Request Headers (BROWSER-SPECIFIC)",
+    "-" * 70,
+    "",
+    "  📌 FIREFOX (Recommended):",
+    "     • Click on the 'browse' request",
+    "     • Right-click → Copy → Copy Request Headers",
+    "     • Done! That's it.",
+    "",
+    "  📌 CHROME / EDGE / ANY BROWSER:",
+    "     • Click on the 'browse' request",
+    "     • **BEST OPTION:** Right-click request -> Copy -> **Copy as cURL (bash)**",
+    "     • Run this script and paste the whole thing.",
+    "",
+    "=" * 70,
+    "",
+])
+
+_COMMON_ISSUES = "\n".join([
+    "",
+    "Common issues:",
+    "  1. x-goog-visitor-id is REQUIRED for playlist operations",
+    "  2. Make sure you copied the COMPLETE cURL command",
+    "  3. Make sure you're copying from music.youtube.com (not youtube.com)",
+    "  4. Try copying from a different 'browse' POST request",
+    "  5. Firefox 'Copy Request Headers' or Chrome 'Copy as cURL (bash)' work best",
+    "",
+])
+
 def print_instructions():
     """Print detailed browser-specific instructions."""
     print_header("YOUTUBE MUSIC SETUP", "Simple Browser Authentication")
-    
-    print("This is EASY! Just follow the steps for your browser:")
-    print()
-    print("-" * 70)
-    print("STEP 1: Open YouTube Music and Sign In")
-    print("-" * 70)
-    print("  1. Go to: https://music.youtube.com")
-    print("  2. Make sure you're SIGNED IN with your Google account")
-    print()
-    print("-" * 70)
-    print("STEP 2: Open Developer Tools")
-    print("-" * 70)
-    print("  • Press F12 (or Right-click → Inspect)")
-    print("  • Click the 'Network' tab at the top")
-    print()
-    print("-" * 70)
-    print("STEP 3: Find an Authenticated Request")
-    print("-" * 70)
-    print("  • In the Network tab filter box, type: browse")
-    print("  • Click on 'Library' in YouTube Music (left sidebar)")
-    print("  • Look for a POST request with these details:")
-    print("      ✓ Status: 200")
-    print("      ✓ Method: POST")
-    print("      ✓ Name/File: browse?...")
-    print()
-    print("-" * 70)
-    print("STEP 4: Copy Request Headers (BROWSER-SPECIFIC)")
-    print("-" * 70)
-    print()
-    print("  📌 FIREFOX (Recommended):")
-    print("     • Click on the 'browse' request")
-    print("     • Right-click → Copy → Copy Request Headers")
-    print("     • Done! That's it.")
-    print()
-    print("  📌 CHROME / EDGE / ANY BROWSER:")
-    print("     • Click on the 'browse' request")
-    print("     • **BEST OPTION:** Right-click request -> Copy -> **Copy as cURL (bash)**")
-    print("     • Run this script and paste the whole thing.")
-    print()
-    print("=" * 70)
-    print()
+    safe_print(_INSTRUCTIONS)
+
+def verify_connection(auth_path, headers):
+    """Test the saved headers against YouTube Music (one library request)."""
+    print_info("Testing connection...")
+
+    try:
+        from ytmusicapi import YTMusic
+        ytm = YTMusic(auth_path)
+
+        # Test with actual playlist access (not just search)
+        try:
+            # Try to get user's playlists - this requires proper auth
+            playlists = ytm.get_library_playlists(limit=1)
+
+            if playlists is not None:  # Even empty list is success
+                print()
+                print("=" * 70)
+                print_success("SUCCESS! YouTube Music is connected and working!")
+                print("=" * 70)
+                print()
+                if playlists:
+                    print(f"  Found {len(playlists)} playlist(s) in your library.")
+                else:
+                    print("  No playlists found (but authentication works!)")
+                print()
+                print("You can now:")
+                print("  • Run the main app: python app.py")
+                print("  • Or sync directly: python sync_playlists.py")
+                print()
+            else:
+                print()
+                print_warning("Connection test completed, but results are unclear.")
+                print()
+                print("The headers are saved. Try running the sync to see if it works:")
+                print("  python sync_playlists.py --test-ytmusic")
+
+        except Exception as search_error:
+            error_str = str(search_error)
+            if "401" in error_str or "unauthorized" in error_str.lower():
+                print()
+                print_error("Authentication failed (401 Unauthorized)!")
+                print()
+                print("Common fixes:")
+                print("  1. Missing x-goog-visitor-id header (REQUIRED for playlists)")
+                print("  2. Make sure you copied from music.youtube.com (not youtube.com)")
+                print("  3. Copy from a 'browse' POST request, not GET")
+                print("  4. Make sure you're logged in to YouTube Music")
+                print("  5. Try copying fresh headers (cookies expire)")
+                print()
+                if 'x-goog-visitor-id' not in headers:
+                    print_warning("DETECTED: x-goog-visitor-id is MISSING from your headers!")
+                    print("   This header is REQUIRED for playlist operations.")
+                    print("   Make sure you copy the FULL cURL command including ALL headers.")
+                print()
+            elif "400" in error_str or "bad request" in error_str.lower():
+                print()
+                print_warning("Request format issue")
+                print()
+                # ... (rest of error handling same as before but using print_warning)
+                print("This usually means:")
+                print("  • Headers might be incomplete")
+                print("  • Try copying from a different 'browse' request")
+                print("  • Make sure you selected the FULL headers")
+                print()
+            else:
+                print()
+                print_warning(f"Connection test error: {search_error}")
+                print()
+                print("Headers are saved, but verification failed.")
+                print("Try running the sync to see if it works anyway:")
+                print("  python sync_playlists.py --test-ytmusic")
+                print()
+
+    except ImportError:
+        print()
+        print_error("ytmusicapi not installed!")
+        print("   Run: pip install ytmusicapi")
+    except Exception as e:
+        print()
+        print_warning(f"Unexpected error: {e}")
+        print()
+        print("Headers saved. Try testing with:")
+        print("  python sync_playlists.py --test-ytmusic")
 
 def main():
     print_instructions()
 
-    headers_text = get_multiline_input("Paste your request headers below (then press Enter twice):")
+    headers_text = get_multiline_input("Paste your request headers below:")
 
     if not headers_text or len(headers_text) < 100:
         print()
         print_error("Headers seem too short or empty.")
         print_info("Make sure you copied the full request headers.")
-        input("\nPress Enter to exit...")
+        pause("Press Enter to exit...")
         return
 
+    has_cookie, from_ytmusic = precheck_headers_text(headers_text)
+    if not has_cookie:
+        print()
+        print_error("No cookie found in what you pasted.")
+        print_info("Copy the headers of a request made while signed in to YouTube Music.")
+        pause("Press Enter to exit...")
+        return
+    if not from_ytmusic:
+        print()
+        print_warning("These don't look like music.youtube.com headers (youtube.com won't work).")
+
     # Parse headers
     try:
         headers = parse_headers(headers_text)
 
         # Show what was extracted
-        print()
-        print("=" * 70)
-        print("EXTRACTED HEADERS:")
-        print("=" * 70)
+        lines = ["", "=" * 70, "EXTRACTED HEADERS:", "=" * 70]
         
         required = ['cookie', 'authorization', 'x-goog-authuser', 'x-goog-visitor-id']
         all_good = True
@@ -92,25 +201,18 @@ def main():
         for key in required:
             if key in headers:
                 preview = headers[key][:60] + "..." if len(headers[key]) > 60 else headers[key]
-                print(f"[OK] {key}: {preview}")
+                lines.append(f"[OK] {key}: {preview}")
             else:
-                print(f"[MISSING] {key}")
+                lines.append(f"[MISSING] {key}")
                 all_good = False
         
-        print("=" * 70)
-        print()
+        lines += ["=" * 70, ""]
+        safe_print("\n".join(lines))
 
         if not all_good:
             print_error("Missing required headers!")
-            print()
-            print("Common issues:")
-            print("  1. x-goog-visitor-id is REQUIRED for playlist operations")
-            print("  2. Make sure you copied the COMPLETE cURL command")
-            print("  3. Make sure you're copying from music.youtube.com (not youtube.com)")
-            print("  4. Try copying from a different 'browse' POST request")
-            print("  5. Firefox 'Copy Request Headers' or Chrome 'Copy as cURL (bash)' work best")
-            print()
-            input("Press Enter to exit...")
+            safe_print(_COMMON_ISSUES)
+            pause("Press Enter to exit...")
             return
 
         # Save to file
@@ -119,87 +221,25 @@ def main():
 
         print_success("Headers saved to browser_auth.json")
         print()
-        print_info("Testing connection...")
 
-        # Test the connection with better error handling
-        try:
-            from ytmusicapi import YTMusic
-            ytm = YTMusic(auth_path)
-
-            # Test with actual playlist access (not just search)
-            try:
-                # Try to get user's playlists - this requires proper auth
-                playlists = ytm.get_library_playlists(limit=1)
-                
-                if playlists is not None:  # Even empty list is success
-                    print()
-                    print("=" * 70)
-                    print_success("SUCCESS! YouTube Music is connected and working!")
-                    print("=" * 70)
-                    print()
-                    if playlists:
-                        print(f"  Found {len(playlists)} playlist(s) in your library.")
-                    else:
-                        print("  No playlists found (but authentication works!)")
-                    print()
-                    print("You can now:")
-                    print("  • Run the main app: python app.py")
-                    print("  • Or sync directly: python sync_playlists.py")
-                    print()
-                else:
-                    print()
-                    print_warning("Connection test completed, but results are unclear.")
-                    print()
-                    print("The headers are saved. Try running the sync to see if it works:")
-                    print("  python sync_playlists.py --test-ytmusic")
-
-            except Exception as search_error:
-                error_str = str(search_error)
-                if "401" in error_str or "unauthorized" in error_str.lower():
-                    print()
-                    print_error("Authentication failed (401 Unauthorized)!")
-                    print()
-                    print("Common fixes:")
-                    print("  1. Missing x-goog-visitor-id header (REQUIRED for playlists)")
-                    print("  2. Make sure you copied from music.youtube.com (not youtube.com)")
-                    print("  3. Copy from a 'browse' POST request, not GET")
-                    print("  4. Make sure you're logged in to YouTube Music")
-                    print("  5. Try copying fresh headers (cookies expire)")
-                    print()
-                    if 'x-goog-visitor-id' not in headers:
-                        print_warning("DETECTED: x-goog-visitor-id is MISSING from your headers!")
-                        print("   This header is REQUIRED for playlist operations.")
-                        print("   Make sure you copy the FULL cURL command including ALL headers.")
-                    print()
-                elif "400" in error_str or "bad request" in error_str.lower():
-                    print()
-                    print_warning("Request format issue")
-                    print()
-                    # ... (rest of error handling same as before but using print_warning)
-                    print("This usually means:")
-                    print("  • Headers might be incomplete")
-                    print("  • Try copying from a different 'browse' request")
-                    print("  • Make sure you selected the FULL headers")
-                    print()
-                else:
-                    print()
-                    print_warning(f"Connection test error: {search_error}")
-                    print()
-                    print("Headers are saved, but verification failed.")
-                    print("Try running the sync to see if it works anyway:")
-                    print("  python sync_playlists.py --test-ytmusic")
-                    print()
-
-        except ImportError:
-            print()
-            print_error("ytmusicapi not installed!")
-            print("   Run: pip install ytmusicapi")
-        except Exception as e:
-            print()
-            print_warning(f"Unexpected error: {e}")
+        if "--verify-network" in sys.argv:
+            verify_connection(auth_path, headers)
+        else:
+            cookie_ok, cookie_msg = check_auth_cookie(headers)
+            if cookie_ok:
+                print_success("Headers look good!")
+                print()
+                print("You can now:")
+                print("  • Run the main app: python app.py")
+                print("  • Or sync directly: python sync_playlists.py")
+                print()
+                print_info("To test them against YouTube Music now, re-run with --verify-network")
+            else:
+                print_warning(cookie_msg)
+                print()
+                print("The headers are saved, but will probably be rejected.")
+                print("Try copying fresh headers from a signed-in music.youtube.com tab.")
             print()
-            print("Headers saved. Try testing with:")
-            print("  python sync_playlists.py --test-ytmusic")
 
     except Exception as e:
         print()
@@ -207,7 +247,8 @@ def main():
         print("   Something went wrong parsing the headers.")
         print("   Make sure you copied the raw request headers correctly.")
     print()
-    input("Press Enter to exit...")
+    pause("Press Enter to exit...")
 
 if __name__ == "__main__":
+    make_stdout_lenient()
     main()
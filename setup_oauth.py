@@ -22,59 +22,50 @@ If you still want to use OAuth, continue below.
 ========================
 
 Uses Google's OAuth Device Authorization flow.
+
+Usage:
+    python setup_oauth.py          # Reuse oauth.json if its token still works
+    python setup_oauth.py --force  # Always run the full flow (new account/client)
 """
 
 import os
 import sys
 import json
 import time
+import random
+import importlib.util
+from email.utils import parsedate_to_datetime
 
-print()
-print("=" * 60)
-print("⚠️  DEPRECATION WARNING")
-print("=" * 60)
-print()
-print("This OAuth setup is now DEPRECATED.")
-print("We recommend using the simpler browser auth method instead:")
-print()
-print("  → Run: python setup_browser_auth.py")
-print()
-print("Browser auth is much easier (2 minutes vs 10-15 minutes)")
-print("and doesn't require a Google Cloud project.")
-print()
-choice = input("Continue with OAuth anyway? (y/N): ").strip().lower()
+# Fixed screens, built once and written with a single call each
+_RULE = "=" * 60
+_THIN_RULE = "-" * 60
 
-if choice != 'y':
-    print()
-    print("Good choice! Run: python setup_browser_auth.py")
-    print()
-    sys.exit(0)
+_DEPRECATION_BANNER = f"""
+{_RULE}
+⚠️  DEPRECATION WARNING
+{_RULE}
 
-print()
-print("Continuing with OAuth setup...")
-print()
+This OAuth setup is now DEPRECATED.
+We recommend using the simpler browser auth method instead:
 
-try:
-    import requests
-except ImportError:
-    print("Installing requests...")
-    import subprocess
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "requests"])
-    import requests
+  → Run: python setup_browser_auth.py
 
+Browser auth is much easier (2 minutes vs 10-15 minutes)
+and doesn't require a Google Cloud project.
+
+"""
+
+_SETUP_INSTRUCTIONS = f"""{_RULE}
+YOUTUBE MUSIC OAUTH SETUP
+{_RULE}
+
+This script will help you set up YouTube Music authentication.
+You only need to do this ONCE.
+
+{_THIN_RULE}
+STEP 1: Google Cloud Console Setup
+{_THIN_RULE}
 
-def main():
-    print("=" * 60)
-    print("YOUTUBE MUSIC OAUTH SETUP")
-    print("=" * 60)
-    print()
-    print("This script will help you set up YouTube Music authentication.")
-    print("You only need to do this ONCE.")
-    print()
-    print("-" * 60)
-    print("STEP 1: Google Cloud Console Setup")
-    print("-" * 60)
-    print("""
 1. Go to: https://console.cloud.google.com/
 2. Create a new project (or select existing)
 3. Go to "APIs & Services" > "Library"
@@ -88,14 +79,200 @@ def main():
    - Application type: "TVs and Limited Input devices"
    - Name it anything (e.g., "Spotify Sync Client")
 7. Copy the Client ID and Client Secret shown
-""")
+
+"""
+
+_STEP2_HEADER = f"{_THIN_RULE}\nSTEP 2: Enter Your Credentials\n{_THIN_RULE}\n"
+_STEP3_HEADER = f"\n{_THIN_RULE}\nSTEP 3: Device Authorization\n{_THIN_RULE}\n"
+
+sys.stdout.write(_DEPRECATION_BANNER)
+choice = input("Continue with OAuth anyway? (y/N): ").strip().lower()
+
+if choice != 'y':
+    sys.stdout.write("\nGood choice! Run: python setup_browser_auth.py\n\n")
+    sys.exit(0)
+
+sys.stdout.write("\nContinuing with OAuth setup...\n\n")
+
+
+def ensure_requests():
+    """Install requests if it's missing (only needed for the OAuth flow)."""
+    if importlib.util.find_spec("requests") is None:
+        print("Installing requests...")
+        import subprocess
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "requests"])
+        importlib.invalidate_caches()
+
+
+# (connect, read) timeout for every request to Google's OAuth endpoints
+REQUEST_TIMEOUT = (3.05, 10)
+
+
+def make_session():
+    """
+    Create the HTTP session used for the device-code request and all polls.
+    
+    Reusing one keep-alive connection avoids a TCP+TLS handshake per poll.
+    Transient 502/503/504 responses are retried with a short backoff.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    retry = Retry(
+        total=3,
+        read=False,  # Don't silently resend a POST whose reply timed out
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset({"POST"}),  # Both endpoints are POST-only
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=retry))
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
+# Give up after this many slow_down replies in a row
+MAX_CONSECUTIVE_SLOW_DOWN = 2
+
+
+def clock_drift_seconds(response):
+    """
+    Local clock minus the server's Date header, in seconds (None if unknown).
+    
+    A badly skewed clock is the usual reason a correctly-paced poller keeps
+    being told to slow down.
+    """
+    try:
+        server_time = parsedate_to_datetime(response.headers["Date"]).timestamp()
+    except (KeyError, TypeError, ValueError):
+        return None
+    return time.time() - server_time
+
+
+def parse_oauth_response(response):
+    """
+    Decode a JSON reply from Google's OAuth endpoints.
+    
+    The raw bytes go straight to json.loads (JSON is always UTF-8), skipping
+    requests' charset detection. Google sends its errors, including
+    authorization_pending, as JSON on 4xx statuses, so those parse normally.
+    Anything that isn't JSON (e.g. an HTML error page from a proxy) becomes
+    an error dict instead of raising.
+    """
+    try:
+        data = json.loads(response.content)
+    except ValueError:
+        data = None
+    if not isinstance(data, dict):
+        return {
+            "error": f"http_{response.status_code}",
+            "error_description": f"Unexpected response from Google (HTTP {response.status_code})"
+        }
+    return data
+
+
+def save_oauth(oauth_path, oauth_data):
+    """
+    Write the OAuth credentials to oauth.json (compact; it's only machine-read).
+    
+    The data goes to oauth.json.tmp, is fsynced, and is then renamed over
+    oauth.json, so an interrupted save never leaves a corrupt file that
+    would force the whole device flow to be redone.
+    """
+    tmp_path = oauth_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        f.write(json.dumps(oauth_data, separators=(",", ":")))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, oauth_path)
+
+
+def try_refresh_existing(session, oauth_path):
+    """
+    Reuse an existing oauth.json if its refresh token still works.
+    
+    Exchanges the stored refresh token for a new access token and saves it,
+    so re-running the script doesn't repeat the whole interactive flow.
+    
+    Returns:
+        True if oauth.json was refreshed, False if the full flow is needed
+    """
+    import requests
+    
+    try:
+        with open(oauth_path, "r") as f:
+            oauth_data = json.load(f)
+        response = session.post(
+            "https://oauth2.googleapis.com/token",
+            data={
+                "client_id": oauth_data["client_id"],
+                "client_secret": oauth_data["client_secret"],
+                "refresh_token": oauth_data["refresh_token"],
+                "grant_type": "refresh_token"
+            },
+            timeout=REQUEST_TIMEOUT
+        )
+        token_response = parse_oauth_response(response)
+    except (OSError, ValueError, KeyError, requests.exceptions.RequestException):
+        return False
+    
+    if "access_token" not in token_response:
+        return False
+    
+    oauth_data["access_token"] = token_response["access_token"]
+    oauth_data["expires_in"] = token_response.get("expires_in", 3600)
+    # Google may rotate the refresh token
+    if "refresh_token" in token_response:
+        oauth_data["refresh_token"] = token_response["refresh_token"]
+    save_oauth(oauth_path, oauth_data)
+    return True
+
+
+def wait_for_next_poll(interval, poll_started):
+    """
+    Wait until about `interval` seconds after the last poll was sent.
+    
+    The time already spent on the request counts towards the interval, so
+    polls go out every `interval` seconds rather than every interval + RTT.
+    Adds up to 25% random jitter so clients don't poll in lockstep, and
+    exits if Ctrl-C is pressed during the wait.
+    """
+    delay = interval + random.uniform(0, 0.25 * interval)
+    try:
+        # time.sleep is interrupted by Ctrl-C on Windows too, unlike Event.wait
+        time.sleep(max(0.0, delay - (time.monotonic() - poll_started)))
+    except KeyboardInterrupt:
+        print("\n\n❌ Cancelled.")
+        sys.exit(130)
+
+
+def main():
+    # Save to oauth.json in the same directory as this script
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    oauth_path = os.path.join(script_dir, "oauth.json")
+    
+    ensure_requests()
+    import requests
+    session = make_session()
+    
+    force = "--force" in sys.argv
+    if not force and os.path.exists(oauth_path) and try_refresh_existing(session, oauth_path):
+        sys.stdout.write(
+            "✅ Existing oauth.json is still valid - access token refreshed.\n\n"
+            f"Updated: {oauth_path}\n\n"
+            "You can now run: python sync_playlists.py\n\n"
+            "To set up a different account or client, run with --force\n"
+            "(or delete oauth.json) and go through the full setup.\n\n"
+        )
+        return
+    
+    sys.stdout.write(_SETUP_INSTRUCTIONS)
     
     input("Press ENTER when you have your Client ID and Client Secret ready...")
     print()
     
-    print("-" * 60)
-    print("STEP 2: Enter Your Credentials")
-    print("-" * 60)
+    sys.stdout.write(_STEP2_HEADER)
     
     client_id = input("Enter your Client ID: ").strip()
     client_secret = input("Enter your Client Secret: ").strip()
@@ -104,19 +281,21 @@ def main():
         print("\n❌ Error: Client ID and Client Secret are required!")
         sys.exit(1)
     
-    print()
-    print("-" * 60)
-    print("STEP 3: Device Authorization")
-    print("-" * 60)
+    sys.stdout.write(_STEP3_HEADER)
     
     # Get device code from Google
-    code_response = requests.post(
-        "https://oauth2.googleapis.com/device/code",
-        data={
-            "client_id": client_id,
-            "scope": "https://www.googleapis.com/auth/youtube"
-        }
-    ).json()
+    try:
+        code_response = parse_oauth_response(session.post(
+            "https://oauth2.googleapis.com/device/code",
+            data={
+                "client_id": client_id,
+                "scope": "https://www.googleapis.com/auth/youtube"
+            },
+            timeout=REQUEST_TIMEOUT
+        ))
+    except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+        print("\n❌ Error: Couldn't reach Google. Check your connection and try again.")
+        sys.exit(1)
     
     if "error" in code_response:
         error_msg = code_response.get("error_description", code_response["error"])
@@ -131,71 +310,91 @@ def main():
     verification_url = code_response["verification_url"]
     interval = code_response.get("interval", 5)
     
-    print()
-    print("=" * 60)
-    print("AUTHORIZATION REQUIRED")
-    print("=" * 60)
-    print()
-    print(f"1. Go to: {verification_url}")
-    print(f"2. Enter this code: {user_code}")
-    print(f"3. Sign in with your Google account")
-    print()
-    print("=" * 60)
-    print()
-    print("Waiting for you to authorize", end="", flush=True)
+    sys.stdout.write(
+        f"\n{_RULE}\nAUTHORIZATION REQUIRED\n{_RULE}\n\n"
+        f"1. Go to: {verification_url}\n"
+        f"2. Enter this code: {user_code}\n"
+        "3. Sign in with your Google account\n\n"
+        f"{_RULE}\n\n"
+        "Waiting for you to authorize"
+    )
+    sys.stdout.flush()
+    
+    # oauth.json fields known before polling; the token reply fills in the
+    # rest (the None placeholders keep the file's key order)
+    oauth_base = {
+        "access_token": None,
+        "refresh_token": None,
+        "token_type": "Bearer",
+        "expires_in": 3600,
+        "scope": "https://www.googleapis.com/auth/youtube",
+        "client_id": client_id,
+        "client_secret": client_secret
+    }
     
-    # Poll for token
+    write, flush = sys.stdout.write, sys.stdout.flush
+    consecutive_slow_down = 0
+    # Poll for token. The server's interval is the minimum gap *between*
+    # polls, so the first request goes out straight away. Polling at that
+    # floor is already the lowest-latency schedule the server allows: a
+    # smarter (e.g. distribution-fitted) spacing could only lengthen gaps.
     while True:
-        time.sleep(interval)
-        
-        token_response = requests.post(
-            "https://oauth2.googleapis.com/token",
-            data={
-                "client_id": client_id,
-                "client_secret": client_secret,
-                "device_code": device_code,
-                "grant_type": "urn:ietf:params:oauth:grant-type:device_code"
-            }
-        ).json()
+        poll_started = time.monotonic()
+        try:
+            response = session.post(
+                "https://oauth2.googleapis.com/token",
+                data={
+                    "client_id": client_id,
+                    "client_secret": client_secret,
+                    "device_code": device_code,
+                    "grant_type": "urn:ietf:params:oauth:grant-type:device_code"
+                },
+                timeout=REQUEST_TIMEOUT
+            )
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            # A stalled or dropped poll just waits for the next one
+            wait_for_next_poll(interval, poll_started)
+            continue
+        token_response = parse_oauth_response(response)
         
         if "access_token" in token_response:
             # Success! Save credentials
-            oauth_data = {
-                "access_token": token_response["access_token"],
-                "refresh_token": token_response["refresh_token"],
-                "token_type": token_response.get("token_type", "Bearer"),
-                "expires_in": token_response.get("expires_in", 3600),
-                "scope": token_response.get("scope", "https://www.googleapis.com/auth/youtube"),
-                "client_id": client_id,
-                "client_secret": client_secret
-            }
-            
-            # Save to oauth.json in the same directory as this script
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            oauth_path = os.path.join(script_dir, "oauth.json")
-            
-            with open(oauth_path, "w") as f:
-                json.dump(oauth_data, f, indent=2)
+            oauth_data = dict(oauth_base)
+            oauth_data["access_token"] = token_response["access_token"]
+            oauth_data["refresh_token"] = token_response["refresh_token"]
+            for key in ("token_type", "expires_in", "scope"):
+                if key in token_response:
+                    oauth_data[key] = token_response[key]
+            save_oauth(oauth_path, oauth_data)
             
-            print()
-            print()
-            print("=" * 60)
-            print("✅ SUCCESS! OAuth setup complete.")
-            print("=" * 60)
-            print()
-            print(f"Created: {oauth_path}")
-            print()
-            print("You can now run: python sync_playlists.py")
-            print()
+            sys.stdout.write(
+                f"\n\n{_RULE}\n✅ SUCCESS! OAuth setup complete.\n{_RULE}\n\n"
+                f"Created: {oauth_path}\n\n"
+                "You can now run: python sync_playlists.py\n\n"
+            )
             return
             
         elif token_response.get("error") == "authorization_pending":
             # Still waiting for user to authorize
-            print(".", end="", flush=True)
+            consecutive_slow_down = 0
+            write(".")
+            flush()
+            wait_for_next_poll(interval, poll_started)
             continue
         elif token_response.get("error") == "slow_down":
-            # Google wants us to slow down
-            interval += 2
+            # Google wants us to slow down - double the interval (RFC 8628)
+            consecutive_slow_down += 1
+            if consecutive_slow_down > MAX_CONSECUTIVE_SLOW_DOWN:
+                drift = clock_drift_seconds(response)
+                print(f"\n\n❌ Google keeps asking us to slow down (interval is now {interval}s).")
+                if drift is not None:
+                    print(f"   Your clock differs from Google's by {drift:+.1f}s.")
+                    if abs(drift) > 30:
+                        print("   Sync your system clock and run the script again.")
+                print("   Please wait a minute and run the script again.")
+                sys.exit(1)
+            interval = min(interval * 2, 60)
+            wait_for_next_poll(interval, poll_started)
             continue
         elif token_response.get("error") == "access_denied":
             print("\n\n❌ Authorization was denied. Please try again.")
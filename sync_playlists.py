@@ -10,10 +10,12 @@ Usage:
 """
 
 import os
+import re
 import sys
 import json
 import argparse
 from datetime import datetime
+from difflib import SequenceMatcher
 from typing import Optional
 
 # Third-party imports
@@ -55,6 +57,17 @@ def log(message: str, also_print: bool = True):
         pass  # Don't fail if logging fails
 
 
+# =============================================================================
+# TRACK TEXT NORMALIZATION
+# =============================================================================
+
+# Compiled once - these run for every Spotify track against every YT track
+_PARENS_RE = re.compile(r'\([^)]*\)')
+_BRACKETS_RE = re.compile(r'\[[^\]]*\]')
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
 # =============================================================================
 # SYNC CACHE - Track what's already been synced
 # =============================================================================
@@ -260,19 +273,16 @@ def simple_track_match(spotify_name: str, spotify_artist: str, yt_tracks: list[d
     Fuzzy match using SequenceMatcher to find similar songs.
     Returns True if a match is found with >= 70% similarity.
     """
-    from difflib import SequenceMatcher
-    import re
-    
     def clean_text(text: str) -> str:
         """Clean text for comparison."""
         text = text.lower().strip()
         # Remove parenthetical content
-        text = re.sub(r'\([^)]*\)', '', text)
-        text = re.sub(r'\[[^\]]*\]', '', text)
+        text = _PARENS_RE.sub('', text)
+        text = _BRACKETS_RE.sub('', text)
         # Remove punctuation
-        text = re.sub(r'[^\w\s]', '', text)
+        text = _PUNCTUATION_RE.sub('', text)
         # Collapse spaces
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
         return text
     
     clean_spotify = clean_text(spotify_name)
@@ -346,14 +356,12 @@ def test_ytmusic_auth():
 
 def normalize_track_key(name: str, artist: str) -> str:
     """Create a normalized key for track comparison (aggressive normalization)."""
-    import re
-    
     def clean(text: str) -> str:
         text = text.lower().strip()
         
         # Remove anything in parentheses or brackets
-        text = re.sub(r'\([^)]*\)', '', text)
-        text = re.sub(r'\[[^\]]*\]', '', text)
+        text = _PARENS_RE.sub('', text)
+        text = _BRACKETS_RE.sub('', text)
         
         # Remove common suffixes/prefixes
         suffixes = [
@@ -367,10 +375,10 @@ def normalize_track_key(name: str, artist: str) -> str:
                 text = text.split(suffix)[0]
         
         # Remove punctuation except spaces
-        text = re.sub(r'[^\w\s]', '', text)
+        text = _PUNCTUATION_RE.sub('', text)
         
         # Collapse multiple spaces
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
         
         return text
     
@@ -387,7 +395,6 @@ def sync_playlists(dry_run: bool = False):
     Args:
         dry_run: If True, only show what would be synced without actually syncing
     """
-    from datetime import datetime
     sync_start_time = datetime.now()
     
     log("=" * 60)
@@ -626,7 +633,6 @@ def sync_playlists(dry_run: bool = False):
         save_sync_cache(sync_cache)
     
     # Calculate sync duration
-    from datetime import datetime
     sync_end_time = datetime.now()
     duration_seconds = (sync_end_time - sync_start_time).total_seconds()
     duration_str = f"{int(duration_seconds // 60)}m {int(duration_seconds % 60)}s" if duration_seconds >= 60 else f"{int(duration_seconds)}s"
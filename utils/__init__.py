@@ -1,33 +1,52 @@
 """
 Utils Package - Shared utilities for Spotify to YouTube Music Sync
+
+Re-exported names are resolved lazily (PEP 562): the submodule that
+defines one is only imported the first time it is accessed.
 """
 
-from .clients import (
-    get_spotify_client,
-    get_ytmusic_client,
-    test_spotify_connection,
-    test_ytmusic_connection,
-)
-
-from .ui import (
-    clear_screen,
-    print_header,
-    print_menu,
-    print_submenu,
-    get_choice,
-    pause,
-    safe_print,
-    print_status,
-    print_success,
-    print_error,
-    print_warning,
-    print_info,
-)
+import importlib
+
+# Re-exported name -> submodule that defines it
+_LAZY = {
+    # Clients
+    'get_spotify_client': 'clients',
+    'get_ytmusic_client': 'clients',
+    'test_spotify_connection': 'clients',
+    'test_ytmusic_connection': 'clients',
+    # UI
+    'clear_screen': 'ui',
+    'print_header': 'ui',
+    'print_menu': 'ui',
+    'print_submenu': 'ui',
+    'get_choice': 'ui',
+    'pause': 'ui',
+    'safe_print': 'ui',
+    'print_status': 'ui',
+    'print_success': 'ui',
+    'print_error': 'ui',
+    'print_warning': 'ui',
+    'print_info': 'ui',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(f".{_LAZY[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     # Clients
     'get_spotify_client',
-    'get_ytmusic_client', 
+    'get_ytmusic_client',
     'test_spotify_connection',
     'test_ytmusic_connection',
     # UI
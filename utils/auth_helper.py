@@ -2,42 +2,65 @@ import re
 import json
 import os
 
+# cURL bash format: -H 'name: value' and -b 'cookie'
+_CURL_HEADER_RE = re.compile(r"-H\s+'([^']+):\s*([^']+)'")
+_CURL_COOKIE_RE = re.compile(r"-b\s+'([^']+)'")
+
+# Raw format: one 'Name: Value' per line (pseudo-headers like ':authority'
+# and the 'curl ...' line itself don't match)
+_RAW_HEADER_RE = re.compile(r"(?m)^[ \t]*([A-Za-z0-9-]+):[ \t]*(.*?)[ \t\r]*$")
+
+# The only headers save_browser_auth() and the setup checks ever use;
+# everything else in a paste (often ~30 entries) is skipped while parsing
+_WANTED_HEADERS = frozenset({
+    'accept', 'accept-language', 'content-type', 'cookie', 'user-agent',
+    'x-goog-authuser', 'x-goog-visitor-id', 'authorization', 'origin',
+})
+
 def parse_headers(headers_text):
     """
     Universal parser that handles:
     1. Firefox: Copy Request Headers (Key: Value on lines)
     2. Chrome: Copy as cURL (bash) with -H 'key: value'
+    Only the headers in _WANTED_HEADERS are kept.
     """
     headers = {}
     text = headers_text.strip()
     
     # METHOD 1: cURL bash format (-H 'name: value')
-    curl_h_pattern = r"-H\s+'([^']+):\s*([^']+)'"
-    for key, value in re.findall(curl_h_pattern, text):
-        headers[key.strip().lower()] = value.strip()
+    if "-H" in text:
+        for key, value in _CURL_HEADER_RE.findall(text):
+            key = key.strip().lower()
+            if key in _WANTED_HEADERS:
+                headers[key] = value.strip()
     
     # METHOD 1b: cURL cookie (-b 'cookie')
-    curl_cookie_pattern = r"-b\s+'([^']+)'"
-    cookie_match = re.search(curl_cookie_pattern, text)
+    cookie_match = _CURL_COOKIE_RE.search(text) if "-b" in text else None
     if cookie_match:
         headers['cookie'] = cookie_match.group(1).strip()
     
     # METHOD 2: Raw format like Firefox (Name: Value on lines)
     # Only do this if cURL didn't work or we're missing critical headers
     if not headers or 'x-goog-visitor-id' not in headers:
-        lines = text.split('\n')
-        for line in lines:
-            if ':' in line and not line.startswith('curl'):
-                parts = line.split(':', 1)
-                if len(parts) == 2:
-                    key = parts[0].strip().lower()
-                    value = parts[1].strip()
-                    # Only capture if not already found or value is longer
-                    if key not in headers or len(value) > len(headers.get(key, '')):
-                        headers[key] = value
+        for key, value in _RAW_HEADER_RE.findall(text):
+            key = key.lower()
+            if key not in _WANTED_HEADERS:
+                continue
+            # Only capture if not already found or value is longer
+            if key not in headers or len(value) > len(headers[key]):
+                headers[key] = value
     
     return headers
 
+def precheck_headers_text(headers_text):
+    """
+    Cheap substring checks on the raw paste, done before parsing it.
+    Returns (has_cookie, from_ytmusic)
+    """
+    lowered = headers_text.lower()
+    has_cookie = 'cookie:' in lowered or "-b '" in lowered
+    return (has_cookie, 'music.youtube.com' in lowered)
+
 def validate_headers(headers):
     """
     Check if all required headers are present.
@@ -47,9 +70,25 @@ def validate_headers(headers):
     missing = [key for key in required if key not in headers]
     return (len(missing) == 0, missing)
 
+def check_auth_cookie(headers):
+    """
+    Offline sanity check of the cookie, so setup can skip a network probe.
+    ytmusicapi signs requests with the __Secure-3PAPISID cookie, so without
+    it the headers can never authenticate.
+    Returns (is_ok, message)
+    """
+    cookie = headers.get('cookie', '')
+    if len(cookie) < 50:
+        return (False, "Cookie header looks truncated.")
+    if '__Secure-3PAPISID=' not in cookie:
+        return (False, "Cookie is missing __Secure-3PAPISID - are you signed in to music.youtube.com?")
+    return (True, "Cookie looks valid.")
+
 def save_browser_auth(headers, file_path='browser_auth.json'):
     """
     Save headers to browser_auth.json with the correct structure.
+    The file is written to a temp file and renamed into place, so an
+    interrupted save never leaves a truncated browser_auth.json behind.
     """
     auth_data = {
         "accept": headers.get("accept", "*/*"),
@@ -63,7 +102,10 @@ def save_browser_auth(headers, file_path='browser_auth.json'):
         "origin": headers.get("origin", "https://music.youtube.com")
     }
     
-    with open(file_path, "w") as f:
-        json.dump(auth_data, f, indent=2)
+    data = json.dumps(auth_data, indent=2).encode("utf-8")
+    tmp_path = file_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, file_path)
     
     return True
@@ -6,15 +6,42 @@ Single source of truth for API client creation and authentication.
 
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Authenticated clients are reused across menu actions until their
+# credentials change: {name: (credentials_key, client)}
+_CLIENT_CACHE = {}
+
+_SPOTIFY_SETTINGS = ("SPOTIFY_CLIENT_ID", "SPOTIFY_CLIENT_SECRET", "SPOTIFY_REDIRECT_URI")
+
+
+def _read_spotify_settings() -> tuple:
+    """
+    Read (client_id, client_secret, redirect_uri) from config.py.
+    
+    The values are parsed from the file's source, so picking up freshly
+    edited credentials doesn't re-execute config.py. Falls back to the
+    config module if they aren't plain literals.
+    """
+    from config_updater import read_config_literals, maybe_reload_config
+    try:
+        values = read_config_literals(set(_SPOTIFY_SETTINGS))
+    except (OSError, SyntaxError, ValueError):
+        values = vars(maybe_reload_config())
+    return tuple(values.get(name) for name in _SPOTIFY_SETTINGS)
+
 
 def get_spotify_client():
     """
     Create and return an authenticated Spotify client.
     
+    The client is cached and rebuilt only when the configured
+    credentials change.
+    
     Returns:
         spotipy.Spotify: Authenticated Spotify client
     
@@ -25,29 +52,69 @@ def get_spotify_client():
     try:
         import spotipy
         from spotipy.oauth2 import SpotifyOAuth
-        import config
-        import importlib
-        # Reload config to get latest credentials
-        importlib.reload(config)
+        key = _read_spotify_settings()
     except ImportError as e:
         raise ImportError(f"Required package not installed: {e}")
     
+    client_id, client_secret, redirect_uri = key
+    cached_key, cached = _CLIENT_CACHE.get('spotify', (None, None))
+    if cached is not None and cached_key == key:
+        return cached
+    
     try:
         sp = spotipy.Spotify(auth_manager=SpotifyOAuth(
-            client_id=config.SPOTIFY_CLIENT_ID,
-            client_secret=config.SPOTIFY_CLIENT_SECRET,
-            redirect_uri=config.SPOTIFY_REDIRECT_URI,
+            client_id=client_id,
+            client_secret=client_secret,
+            redirect_uri=redirect_uri,
             scope="playlist-read-private playlist-read-collaborative"
         ))
+        _CLIENT_CACHE['spotify'] = (key, sp)
         return sp
     except Exception as e:
         raise Exception(f"Failed to authenticate with Spotify: {e}")
 
 
+def get_all_spotify_playlists(sp, page_size: int = 50, max_workers: int = 5) -> list:
+    """
+    Fetch every playlist in the current user's Spotify library.
+    
+    The first page tells us the total, so the remaining pages are requested
+    concurrently by offset instead of walking the 'next' links one by one.
+    Rate limiting (429) is retried by spotipy's own retry/backoff handling.
+    
+    Args:
+        sp: Authenticated spotipy.Spotify client
+        page_size: Playlists per request (Spotify allows up to 50)
+        max_workers: Maximum concurrent page requests
+    
+    Returns:
+        List of Spotify playlist objects, in library order
+    """
+    first = sp.current_user_playlists(limit=page_size)
+    playlists = list(first['items'])
+    
+    limit = first.get('limit') or page_size
+    offsets = range(limit, first.get('total', 0), limit)
+    if not offsets:
+        return playlists
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(offsets))) as executor:
+        pages = executor.map(
+            lambda offset: sp.current_user_playlists(limit=limit, offset=offset),
+            offsets
+        )
+        for page in pages:
+            playlists.extend(page['items'])
+    
+    return playlists
+
+
 def get_ytmusic_client():
     """
     Create and return an authenticated YouTube Music client.
     
+    The client is cached and rebuilt only when browser_auth.json changes.
+    
     Returns:
         YTMusic: Authenticated YouTube Music client
     
@@ -73,13 +140,63 @@ def get_ytmusic_client():
             "Please run 'python setup_browser_auth.py' first."
         )
     
+    key = os.stat(auth_file).st_mtime_ns
+    cached_key, cached = _CLIENT_CACHE.get('ytmusic', (None, None))
+    if cached is not None and cached_key == key:
+        return cached
+    
     try:
         ytm = YTMusic(auth_file)
+        _CLIENT_CACHE['ytmusic'] = (key, ytm)
         return ytm
     except Exception as e:
         raise Exception(f"Failed to authenticate with YouTube Music: {e}")
 
 
+# Seconds a fetched YouTube Music library listing is reused for
+LIBRARY_CACHE_TTL = 60
+
+# Recent library listings: {limit: (client, fetched_at, playlists)}
+_LIBRARY_CACHE = {}
+
+
+def get_ytmusic_library_playlists(limit: int = 20, max_age: float = LIBRARY_CACHE_TTL) -> list:
+    """
+    Fetch the user's YouTube Music library playlists, reusing a recent result.
+    
+    Browsing the menus tends to list the library several times in a row;
+    within `max_age` seconds the previous response is returned instead of
+    making another request. A new client (e.g. after re-auth) always refetches.
+    
+    Args:
+        limit: Number of playlists to fetch
+        max_age: How long (seconds) a cached listing stays valid
+    
+    Returns:
+        List of playlist dicts as returned by ytmusicapi
+    """
+    ytm = get_ytmusic_client()
+    now = time.monotonic()
+    cached = _LIBRARY_CACHE.get(limit)
+    if cached is not None and cached[0] is ytm and now - cached[1] < max_age:
+        return cached[2]
+    
+    playlists = ytm.get_library_playlists(limit=limit)
+    _LIBRARY_CACHE[limit] = (ytm, now, playlists)
+    return playlists
+
+
+def invalidate_library_cache():
+    """Forget cached library listings (call after creating playlists)."""
+    _LIBRARY_CACHE.clear()
+
+
+def reset_clients():
+    """Drop cached clients so the next call re-authenticates."""
+    _CLIENT_CACHE.clear()
+    _LIBRARY_CACHE.clear()
+
+
 def test_spotify_connection() -> tuple:
     """
     Test Spotify connection and return user info.
@@ -130,10 +247,8 @@ def test_ytmusic_connection() -> tuple:
 def check_spotify_configured() -> bool:
     """Check if Spotify credentials are configured."""
     try:
-        import config
-        if (hasattr(config, 'SPOTIFY_CLIENT_ID') and 
-            config.SPOTIFY_CLIENT_ID and 
-            config.SPOTIFY_CLIENT_ID != "YOUR_SPOTIFY_CLIENT_ID"):
+        client_id = _read_spotify_settings()[0]
+        if client_id and client_id != "YOUR_SPOTIFY_CLIENT_ID":
             return True
     except Exception:
         pass
@@ -33,19 +33,34 @@ class Colors:
     BG_BLUE = '\033[44m'
 
 
-def _enable_windows_ansi():
-    """Enable ANSI escape sequences on Windows."""
+def _detect_ansi_support() -> bool:
+    """Enable ANSI sequences on Windows; return whether the terminal supports them."""
     if os.name == 'nt':
         try:
             import ctypes
             kernel32 = ctypes.windll.kernel32
-            kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7)
+            # 7 = processed output | wrap at EOL | virtual terminal processing
+            return bool(kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7))
         except Exception:
-            pass
+            return False
+    return os.environ.get('TERM') not in (None, '', 'dumb')
+
+
+# Enable colors on Windows, and detect dumb terminals elsewhere
+_ANSI_SUPPORTED = _detect_ansi_support()
+
+
+def make_stdout_lenient() -> bool:
+    """Make stdout print '?' for characters it can't encode; returns True on success."""
+    try:
+        sys.stdout.reconfigure(errors='replace')
+        return True
+    except Exception:
+        return False  # Replaced/wrapped stream without reconfigure()
 
 
-# Enable colors on Windows
-_enable_windows_ansi()
+# Clear screen + scrollback, then move the cursor home
+_CLEAR_SEQUENCE = "\033[2J\033[3J\033[H"
 
 
 # =============================================================================
@@ -54,6 +69,13 @@ _enable_windows_ansi()
 
 def clear_screen():
     """Clear the terminal screen."""
+    if _ANSI_SUPPORTED and sys.stdout.isatty():
+        try:
+            sys.stdout.write(_CLEAR_SEQUENCE)
+            sys.stdout.flush()
+            return
+        except Exception:
+            pass
     os.system('cls' if os.name == 'nt' else 'clear')
 
 
@@ -64,26 +86,31 @@ def safe_print(message: str):
     Args:
         message: Text to print (may contain Unicode/emoji)
     """
-    import sys
     try:
-        print(message)
+        sys.stdout.write(message + "\n")
     except UnicodeEncodeError:
         # Windows console (cp1252) can't handle emojis and some Unicode
         # Replace problematic characters with '?'
         encoding = sys.stdout.encoding or 'utf-8'
         safe = message.encode(encoding, errors='replace').decode(encoding)
-        print(safe)
+        sys.stdout.write(safe + "\n")
 
 
-def pause():
-    """Wait for user to press Enter."""
-    input(f"\n{Colors.DIM}Press Enter to continue...{Colors.RESET}")
+def pause(message: str = "Press Enter to continue..."):
+    """Wait for user to press Enter (returns at once if stdin is exhausted)."""
+    try:
+        input(f"\n{Colors.DIM}{message}{Colors.RESET}")
+    except EOFError:
+        pass  # stdin already consumed (e.g. headers piped in)
 
 
 # =============================================================================
 # HEADER AND MENU FUNCTIONS  
 # =============================================================================
 
+_HEADER_RULE = f"{Colors.CYAN}{'=' * 60}{Colors.RESET}"
+
+
 def print_header(title: str, subtitle: str = None):
     """
     Print a styled header with optional subtitle.
@@ -93,14 +120,13 @@ def print_header(title: str, subtitle: str = None):
         subtitle: Optional subtitle text
     """
     clear_screen()
-    width = 60
     
-    print(f"{Colors.CYAN}{'=' * width}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.WHITE}  {title}{Colors.RESET}")
+    lines = [_HEADER_RULE, f"{Colors.BOLD}{Colors.WHITE}  {title}{Colors.RESET}"]
     if subtitle:
-        print(f"{Colors.DIM}  {subtitle}{Colors.RESET}")
-    print(f"{Colors.CYAN}{'=' * width}{Colors.RESET}")
-    print()
+        lines.append(f"{Colors.DIM}  {subtitle}{Colors.RESET}")
+    lines.append(_HEADER_RULE)
+    lines.append("")
+    safe_print("\n".join(lines))
 
 
 def print_menu(options: list, show_back: bool = True):
@@ -111,12 +137,12 @@ def print_menu(options: list, show_back: bool = True):
         options: List of menu option strings
         show_back: Whether to show [0] Back/Exit option
     """
-    for i, option in enumerate(options, 1):
-        safe_print(f"  {Colors.CYAN}[{i}]{Colors.RESET} {option}")
+    lines = [f"  {Colors.CYAN}[{i}]{Colors.RESET} {option}" for i, option in enumerate(options, 1)]
     
     if show_back:
-        print(f"  {Colors.DIM}[0] Back / Exit{Colors.RESET}")
-    print()
+        lines.append(f"  {Colors.DIM}[0] Back / Exit{Colors.RESET}")
+    lines.append("")
+    safe_print("\n".join(lines))
 
 
 def print_submenu(title: str, options: list):
@@ -132,36 +158,103 @@ def print_submenu(title: str, options: list):
     print_menu(options)
 
 
+def _getch():
+    """
+    Read a single keypress without waiting for Enter.
+    
+    Returns:
+        The key as a 1-character string ('\x1b' for any special key), or
+        None if the terminal can't be put into single-key mode.
+    """
+    if os.name == 'nt':
+        import msvcrt
+        key = msvcrt.getwch()
+        if key == '\x03':
+            raise KeyboardInterrupt
+        if key in ('\x00', '\xe0'):
+            msvcrt.getwch()  # Special keys arrive as a prefix + scan code
+            return '\x1b'
+        return key
+    
+    try:
+        import select
+        import termios
+        import tty
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+    except Exception:
+        return None
+    try:
+        tty.setcbreak(fd)  # Ctrl-C still raises KeyboardInterrupt
+        # Read the raw bytes so a whole escape sequence (or UTF-8 character)
+        # comes in at once, instead of being left in sys.stdin's buffer
+        data = os.read(fd, 32)
+        if not data:
+            return None  # Input closed; let the caller fall back
+        if data.startswith(b'\x1b'):
+            # Swallow any rest of the sequence that arrived a moment later
+            while select.select([fd], [], [], 0.02)[0]:
+                os.read(fd, 32)
+            return '\x1b'
+        return data.decode(sys.stdin.encoding or 'utf-8', errors='replace')[:1]
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+
 def get_choice(max_option: int, prompt: str = "Enter choice") -> int:
     """
-    Get a validated numeric choice from user.
+    Get a validated numeric choice from user (single keypress for menus under 10).
     
     Args:
         max_option: Maximum valid option number
         prompt: Prompt text to display
     
     Returns:
-        User's choice as integer (0 to max_option)
+        User's choice as integer (0 to max_option); 0 once input runs out
     """
+    while max_option < 10 and sys.stdin.isatty():
+        sys.stdout.write(f"{prompt}: ")
+        sys.stdout.flush()
+        key = _getch()
+        if key is None:
+            sys.stdout.write("\n")
+            break  # No single-key support; fall back to line input
+        if key in ("\r", "\n", " ", "\x1b"):
+            sys.stdout.write("\r")
+            continue  # Enter, space and special keys are ignored
+        sys.stdout.write(key + "\n")
+        if key.isdecimal() and int(key) <= max_option:
+            return int(key)
+        print_error(f"Please press a number between 0 and {max_option}")
+    
     while True:
         try:
             choice = input(f"{prompt}: ").strip()
-            if choice == "":
-                continue
-            num = int(choice)
-            if 0 <= num <= max_option:
-                return num
-            print_error(f"Please enter a number between 0 and {max_option}")
-        except ValueError:
+        except EOFError:
+            print()
+            return 0  # Input ran out: treat as Back / Exit instead of crashing
+        if choice == "":
+            continue
+        # isdecimal() only accepts what int() can parse, so no try/except needed
+        if not choice.isdecimal():
             print_error("Invalid input. Please enter a number.")
+            continue
+        num = int(choice)
+        if num <= max_option:
+            return num
+        print_error(f"Please enter a number between 0 and {max_option}")
 
 
-def get_multiline_input(prompt: str = "Paste text (Press Enter twice to finish):") -> str:
+_EOF_HINT = "Ctrl-Z then Enter" if os.name == 'nt' else "Ctrl-D"
+
+
+def get_multiline_input(prompt: str = "Paste text below:") -> str:
     """
     Get multi-line input from user.
-    Stops when user enters two empty lines.
+    Stops at end-of-input (Ctrl-D / Ctrl-Z) or when user enters two empty lines.
     """
     print(f"{prompt}")
+    print(f"{Colors.DIM}(finish with {_EOF_HINT}, or press Enter twice){Colors.RESET}")
     print_divider()
     
     # Fix for macOS/Linux input() limitation if needed
@@ -235,27 +328,46 @@ def print_divider(char: str = "-", width: int = 50):
     print(f"{Colors.DIM}{char * width}{Colors.RESET}")
 
 
-def print_box(lines: list, title: str = None):
+def format_box(lines: list, title: str = None) -> str:
     """
-    Print text in a box.
+    Render text in a box, ready to print.
+    
+    Useful for building fixed boxes once instead of on every call.
     
     Args:
         lines: List of lines to display
         title: Optional box title
+    
+    Returns:
+        The box as a single multi-line string
     """
     width = max(len(line) for line in lines) + 4
     if title:
         width = max(width, len(title) + 4)
     
-    print(f"{Colors.CYAN}+{'-' * (width - 2)}+{Colors.RESET}")
+    border = f"{Colors.CYAN}+{'-' * (width - 2)}+{Colors.RESET}"
+    bar = f"{Colors.CYAN}|{Colors.RESET}"
+    
+    out = [border]
     if title:
-        print(f"{Colors.CYAN}|{Colors.RESET} {Colors.BOLD}{title:<{width - 4}}{Colors.RESET} {Colors.CYAN}|{Colors.RESET}")
-        print(f"{Colors.CYAN}+{'-' * (width - 2)}+{Colors.RESET}")
+        out.append(f"{bar} {Colors.BOLD}{title:<{width - 4}}{Colors.RESET} {bar}")
+        out.append(border)
     
-    for line in lines:
-        safe_print(f"{Colors.CYAN}|{Colors.RESET} {line:<{width - 4}} {Colors.CYAN}|{Colors.RESET}")
+    out.extend(f"{bar} {line:<{width - 4}} {bar}" for line in lines)
     
-    print(f"{Colors.CYAN}+{'-' * (width - 2)}+{Colors.RESET}")
+    out.append(border)
+    return "\n".join(out)
+
+
+def print_box(lines: list, title: str = None):
+    """
+    Print text in a box.
+    
+    Args:
+        lines: List of lines to display
+        title: Optional box title
+    """
+    safe_print(format_box(lines, title))
 
 
 # =============================================================================
@@ -7,10 +7,13 @@ Helps differentiate between authentication errors and missing playlists.
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from utils.clients import get_ytmusic_client
+
 
 def is_auth_error(exception) -> bool:
     """
@@ -46,8 +49,6 @@ def check_ytmusic_auth() -> tuple:
         Tuple of (is_valid: bool, message: str, error_type: str)
         error_type can be: 'none', 'missing', 'expired', 'network', 'unknown'
     """
-    import os
-    
     # First check if browser_auth.json exists
     auth_file = os.path.join(
         os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
@@ -59,8 +60,6 @@ def check_ytmusic_auth() -> tuple:
     
     # File exists, now test if the headers are valid
     try:
-        from utils.clients import get_ytmusic_client
-        
         ytm = get_ytmusic_client()
         
         # Try a simple operation to verify auth works
@@ -121,10 +120,19 @@ def validate_playlist_access(ytm, playlist_id: str) -> tuple:
         return (False, 'unknown', f'Error accessing playlist: {str(e)}')
 
 
+# Upper bound on concurrent playlist lookups (keeps us clear of rate limits)
+MAX_VALIDATION_WORKERS = 8
+
+
 def validate_all_playlists(ytm, playlist_mapping: dict) -> dict:
     """
     Validate all playlists in a mapping.
     
+    Playlists found in the user's library are valid without further checks;
+    the rest are looked up individually. Those lookups are network-bound, so
+    they are issued concurrently through a small thread pool. Results keep
+    the order of the mapping.
+    
     Args:
         ytm: YTMusic client instance
         playlist_mapping: Dict of {spotify_id: ytmusic_id}
@@ -145,13 +153,36 @@ def validate_all_playlists(ytm, playlist_mapping: dict) -> dict:
         'unknown_errors': []
     }
     
+    # One paginated library listing replaces most per-playlist lookups
+    library_ids = frozenset()
+    try:
+        library = ytm.get_library_playlists(limit=None) or ()
+        library_ids = frozenset(pl['playlistId'] for pl in library if pl and pl.get('playlistId'))
+    except Exception:
+        pass  # Fall back to checking every playlist individually
+    
+    # Live lookup results for playlists outside the library
+    checked = {}
+    to_check = list(dict.fromkeys(
+        yt_id for yt_id in playlist_mapping.values() if yt_id and yt_id not in library_ids
+    ))
+    if to_check:
+        workers = min(MAX_VALIDATION_WORKERS, len(to_check))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = executor.map(lambda yt_id: validate_playlist_access(ytm, yt_id), to_check)
+            checked = dict(zip(to_check, outcomes))
+    
     for sp_id, yt_id in playlist_mapping.items():
         if not yt_id:
             # No YT playlist mapped
             results['valid'].append((sp_id, yt_id))
             continue
         
-        accessible, error_type, message = validate_playlist_access(ytm, yt_id)
+        if yt_id in library_ids:
+            results['valid'].append((sp_id, yt_id))
+            continue
+        
+        accessible, error_type, message = checked[yt_id]
         
         if accessible:
             results['valid'].append((sp_id, yt_id))